@@ -6,13 +6,13 @@ Run as a module during development:
 Or via the provided bin/hiper launcher:
   hiper fokus
 """
+
 from .cli import main as _main
 
 __all__ = [
     "main",
 ]
 
-def main() -> None:    
-    _main()
-
 
+def main() -> None:
+    _main()
@@ -2,5 +2,3 @@ from . import main
 
 if __name__ == "__main__":
     main()
-
-
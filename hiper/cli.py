@@ -1,38 +1,167 @@
 import argparse
+import functools
 import sys
-from typing import List, Optional
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any
 
-from .commands import COMMAND_REGISTRY, load_builtin_commands
+from .commands import COMMAND_REGISTRY, COMMAND_SPECS, resolve
 
 
-def build_parser() -> argparse.ArgumentParser:
+def _format_command_list(names: Iterable[str]) -> str:
+    """The --list output for the given command names, sorted."""
+    return "".join(
+        ["Available commands:\n"] + [f"  {name}\n" for name in sorted(names)]
+    )
+
+
+# --list output for the builtin commands, built once at import.
+_LIST_OUTPUT = _format_command_list(COMMAND_SPECS)
+
+
+def _is_command(name: str) -> bool:
+    """Builtin commands and ones added with register_command()."""
+    return name in COMMAND_SPECS or name in COMMAND_REGISTRY
+
+
+def _registered_only() -> tuple[str, ...]:
+    """Names of registered commands that have no builtin spec, sorted."""
+    return tuple(sorted(name for name in COMMAND_REGISTRY if name not in COMMAND_SPECS))
+
+
+def _list_output() -> str:
+    extra = _registered_only()
+    if not extra:
+        return _LIST_OUTPUT
+    return _format_command_list([*COMMAND_SPECS, *extra])
+
+
+# argparse exposes no public base class for subparser actions.
+if TYPE_CHECKING:
+    _SubParsersBase = argparse._SubParsersAction[  # type: ignore[reportPrivateUsage]
+        argparse.ArgumentParser
+    ]
+else:
+    _SubParsersBase = argparse._SubParsersAction
+
+
+class _LazySubParsersAction(_SubParsersBase):
+    """Subparsers action that configures a command only once it is selected.
+
+    Subparsers are registered as empty shells carrying just their help text;
+    the matched command's configure_parser runs right before its arguments
+    are parsed, so the others never build their argument specs.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._configured: set[str] = set()
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: str | Sequence[Any] | None,
+        option_string: str | None = None,
+    ) -> None:
+        name = values[0] if isinstance(values, (list, tuple)) else None
+        if isinstance(name, str) and _is_command(name) and name not in self._configured:
+            sub = self._name_parser_map[name]
+            command = resolve(name)
+            sub.description = command.description or command.help
+            if command.configure_parser:
+                command.configure_parser(sub)
+            self._configured.add(name)
+        super().__call__(parser, namespace, values, option_string)
+
+
+def _new_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="hiper",
         description="hiper - a tiny, extensible terminal helper",
     )
-    subparsers = parser.add_subparsers(dest="command", metavar="<command>")
-
-    load_builtin_commands()
+    return parser
 
-    # Dynamically add subparsers from the registry
-    for command_name, command in COMMAND_REGISTRY.items():
-        sub = subparsers.add_parser(
-            command_name,
-            help=command.help,
-            description=command.description or command.help,
-        )
-        command.configure_parser(sub)
 
+def _add_list_argument(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--list",
         action="store_true",
         help="List available commands and exit",
     )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the parser for every builtin and registered command.
+
+    Subparsers are only registered by name and help text; a command module is
+    imported and configured only when that command is actually parsed. The
+    parser is built once per set of registered commands and reused by later
+    calls.
+    """
+    return _build_full_parser(_registered_only())
+
+
+@functools.lru_cache(maxsize=1)
+def _build_full_parser(registered: tuple[str, ...]) -> argparse.ArgumentParser:
+    parser = _new_parser()
+    parser.register("action", "parsers", _LazySubParsersAction)
+    subparsers = parser.add_subparsers(dest="command", metavar="<command>")
+
+    for command_name, spec in COMMAND_SPECS.items():
+        subparsers.add_parser(command_name, help=spec.help)
+    for command_name in registered:
+        subparsers.add_parser(command_name, help=COMMAND_REGISTRY[command_name].help)
+
+    _add_list_argument(parser)
     return parser
 
 
-def main(argv: Optional[List[str]] = None) -> int:
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the command named on the command line, if any.
+
+    Only the leading token is considered: anything starting with '-' before
+    the command (e.g. --help, --list) needs the full parser.
+    """
+    if argv and _is_command(argv[0]):
+        return argv[0]
+    return None
+
+
+@functools.cache
+def _build_single_parser(name: str) -> argparse.ArgumentParser:
+    """Build (once per process) a parser that only knows about one command."""
+    command = resolve(name)
+    parser = _new_parser()
+    subparsers = parser.add_subparsers(dest="command", metavar="<command>")
+    sub = subparsers.add_parser(
+        command.name,
+        help=command.help,
+        description=command.description or command.help,
+    )
+    if command.configure_parser:
+        command.configure_parser(sub)
+    _add_list_argument(parser)
+    return parser
+
+
+def _run(name: str, args: argparse.Namespace) -> int:
+    command = resolve(name)
+    return command.run(args) if command.run else 0
+
+
+def _dispatch(name: str, argv: list[str]) -> int:
+    args = _build_single_parser(name).parse_args(argv)
+    return _run(name, args)
+
+
+def main(argv: list[str] | None = None) -> int:
     argv = list(argv) if argv is not None else sys.argv[1:]
+
+    # Fast path: import and configure only the command that was asked for.
+    sniffed = _sniff_subcommand(argv)
+    if sniffed:
+        return _dispatch(sniffed, argv)
+
     parser = build_parser()
     if not argv:
         parser.print_help()
@@ -40,22 +169,19 @@ def main(argv: Optional[List[str]] = None) -> int:
     args = parser.parse_args(argv)
 
     if getattr(args, "list", False):
-        print("Available commands:")
-        for name in sorted(COMMAND_REGISTRY.keys()):
-            print(f"  {name}")
+        sys.stdout.write(_list_output())
         return 0
 
-    cmd_name: Optional[str] = getattr(args, "command", None)
+    cmd_name: str | None = getattr(args, "command", None)
     if not cmd_name:
         parser.print_help()
         return 0
 
-    command = COMMAND_REGISTRY.get(cmd_name)
-    if not command:
+    if not _is_command(cmd_name):
         print(f"Unknown command: {cmd_name}", file=sys.stderr)
         return 2
 
-    return command.run(args)
+    return _run(cmd_name, args)
 
 
 if __name__ == "__main__":
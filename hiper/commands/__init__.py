@@ -1,33 +1,48 @@
 import argparse
+import importlib
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional
+
+from ._generated_commands import COMMANDS
 
 
 @dataclass
 class Command:
     name: str
     help: str
-    description: Optional[str] = None
-    configure_parser: Callable[[argparse.ArgumentParser], None] = lambda p: None
-    run: Callable[[argparse.Namespace], int] = lambda args: 0
+    description: str | None = None
+    configure_parser: Callable[[argparse.ArgumentParser], None] | None = None
+    run: Callable[[argparse.Namespace], int] | None = None
+
+
+@dataclass
+class CommandSpec:
+    """Where to find a command ("module:factory") and its one-line help."""
+
+    entry_point: str
+    help: str
 
 
-COMMAND_REGISTRY: Dict[str, Command] = {}
+# Builtin commands, from the table generated by scripts/gen_commands.py, so
+# listing commands and rendering `hiper --help` never imports a command module.
+COMMAND_SPECS: dict[str, CommandSpec] = {
+    name: CommandSpec(entry_point, help_text)
+    for name, (entry_point, help_text) in COMMANDS.items()
+}
+
+# Commands that have been resolved (imported) during this process.
+COMMAND_REGISTRY: dict[str, Command] = {}
 
 
 def register_command(cmd: Command):
     COMMAND_REGISTRY[cmd.name] = cmd
 
 
-def load_builtin_commands():
-    """Load all builtin commands into the registry."""
-    from . import backup, finish, fokus, log, postfokus, prefokus, read, set
-
-    register_command(backup.get_command())
-    register_command(finish.get_command())
-    register_command(fokus.get_command())
-    register_command(log.get_command())
-    register_command(postfokus.get_command())
-    register_command(prefokus.get_command())
-    register_command(read.get_command())
-    register_command(set.get_command())
+def resolve(name: str) -> Command:
+    """Import the command's module on first use and return its Command."""
+    command = COMMAND_REGISTRY.get(name)
+    if command is None:
+        module_path, attr = COMMAND_SPECS[name].entry_point.split(":")
+        command = getattr(importlib.import_module(module_path), attr)()
+        register_command(command)
+    return command
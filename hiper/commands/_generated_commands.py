@@ -0,0 +1,37 @@
+# Generated by scripts/gen_commands.py; do not edit by hand.
+
+# name -> ("module:factory", help)
+COMMANDS: dict[str, tuple[str, str]] = {
+    "backup": (
+        "hiper.commands.backup:get_command",
+        "Backup hiper data directory.",
+    ),
+    "finish": (
+        "hiper.commands.finish:get_command",
+        "Finish a goal that has been estimated before.",
+    ),
+    "fokus": (
+        "hiper.commands.fokus:get_command",
+        "Start a focus session.",
+    ),
+    "log": (
+        "hiper.commands.log:get_command",
+        "Append a message or view recent logs.",
+    ),
+    "postfokus": (
+        "hiper.commands.postfokus:get_command",
+        "Show statistics or add a past focus session.",
+    ),
+    "prefokus": (
+        "hiper.commands.prefokus:get_command",
+        "Plan focus goals with estimates and optional deadlines",
+    ),
+    "read": (
+        "hiper.commands.read:get_command",
+        "Manage reading list and track reading progress.",
+    ),
+    "set": (
+        "hiper.commands.set:get_command",
+        "Set configuration options.",
+    ),
+}
@@ -2,6 +2,7 @@ import argparse
 import datetime as dt
 import os
 import shutil
+from collections.abc import Callable
 
 from .. import config
 from . import Command
@@ -18,9 +19,52 @@ def _build_backup_path(data_dir: str) -> str:
     return os.path.join(data_dir, f"backup_{timestamp}")
 
 
-def _ignore_backup_dirs(_dir: str, names: list[str]) -> list[str]:
+def _ignore_backup_dirs(_dir: str, names: list[str]) -> set[str]:
     """Ignore any directories that start with backup_ to avoid nested backups."""
-    return [name for name in names if name.startswith("backup_")]
+    # copytree only tests membership, so a set is returned as-is.
+    return {name for name in names if name.startswith("backup_")}
+
+
+def _latest_backup(data_dir: str) -> str | None:
+    """Return the most recent existing backup_* directory in data_dir, if any."""
+    backups = sorted(
+        entry.path
+        for entry in os.scandir(data_dir)
+        if entry.name.startswith("backup_") and entry.is_dir()
+    )
+    return backups[-1] if backups else None
+
+
+def _make_copy_function(
+    data_dir: str, previous: str | None
+) -> Callable[[str, str], str]:
+    """Return a copytree copy_function that hardlinks unchanged files.
+
+    A file whose size and mtime match its copy in the previous backup is
+    linked to that copy instead of being copied again. Backups are never
+    written to by hiper, so the shared inode stays a valid snapshot; the
+    live files in data_dir are never linked because they are appended to
+    and rewritten in place.
+    """
+
+    def copy(src: str, dst: str) -> str:
+        if previous is not None:
+            prev = os.path.join(previous, os.path.relpath(src, data_dir))
+            try:
+                src_stat = os.stat(src)
+                prev_stat = os.stat(prev)
+                if (
+                    src_stat.st_size == prev_stat.st_size
+                    and src_stat.st_mtime_ns == prev_stat.st_mtime_ns
+                ):
+                    os.link(prev, dst)
+                    return dst
+            except OSError:
+                # Missing in the previous backup or no hardlink support
+                pass
+        return shutil.copy2(src, dst)
+
+    return copy
 
 
 def backup_run(_args: argparse.Namespace) -> int:
@@ -29,14 +73,20 @@ def backup_run(_args: argparse.Namespace) -> int:
         print(f"Error: data_dir '{data_dir}' does not exist")
         return 1
 
+    previous = _latest_backup(data_dir)
     backup_path = _build_backup_path(data_dir)
 
     try:
-        shutil.copytree(data_dir, backup_path, ignore=_ignore_backup_dirs)
+        shutil.copytree(
+            data_dir,
+            backup_path,
+            ignore=_ignore_backup_dirs,
+            copy_function=_make_copy_function(data_dir, previous),
+        )
     except FileExistsError:
         print(f"Error: backup path already exists: {backup_path}")
         return 1
-    except Exception as e:  # pragma: no cover - unexpected errors
+    except Exception as e:  # noqa: BLE001  # pragma: no cover - unexpected errors
         print(f"Error: failed to create backup: {e}")
         return 1
 
@@ -49,7 +99,8 @@ def get_command() -> Command:
         name="backup",
         help="Backup hiper data directory.",
         description="Copy the hiper data directory to a sibling folder with a "
-        "timestamp suffix.",
+        "timestamp suffix. Files unchanged since the previous backup are "
+        "hardlinked to it instead of copied, so do not edit backups in place.",
         configure_parser=backup_configure_parser,
         run=backup_run,
     )
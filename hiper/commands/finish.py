@@ -3,6 +3,15 @@ import argparse
 from .. import storage
 from . import Command
 
+# Columns cleared when a goal is finished; title and time worked are kept.
+_CLEARED_FIELDS = (
+    "estimate_seconds",
+    "estimate_formatted",
+    "estimate_timestamp",
+    "deadline",
+    "start_by",
+)
+
 
 def finish_configure_parser(p: argparse.ArgumentParser) -> None:
     p.add_argument(
@@ -19,41 +28,25 @@ def finish_run(args: argparse.Namespace) -> int:
         print("Error: title cannot be empty")
         return 1
 
-    # Load all goals
-    goals = storage.load_goals_csv()
-
-    # Find the goal with matching title
-    goal_found = False
-    for goal in goals:
-        goal_title_obj = goal.get("title", "")
-        if isinstance(goal_title_obj, str):
-            goal_title = goal_title_obj.strip()
-        else:
-            goal_title = ""
-        if goal_title == title:
-            goal_found = True
-            # Preserve only title, time_worked_seconds, and time_worked_formatted
-            time_worked_seconds = goal.get("time_worked_seconds", 0)
-            time_worked_formatted = goal.get("time_worked_formatted", "")
+    def _matches(row: dict[str, str]) -> bool:
+        return (row.get("title") or "").strip() == title
 
-            # Clear all other fields
-            goal["estimate_seconds"] = 0
-            goal["estimate_formatted"] = ""
-            goal["estimate_timestamp"] = None
-            goal["deadline"] = None
-            goal["start_by"] = None
+    def _clear(row: dict[str, str]) -> dict[str, str]:
+        # Preserve only title, time_worked_seconds, and time_worked_formatted
+        for field in _CLEARED_FIELDS:
+            row[field] = ""
+        return row
 
-            # Keep time_worked fields
-            goal["time_worked_seconds"] = time_worked_seconds
-            goal["time_worked_formatted"] = time_worked_formatted
-            break
+    updated = storage.stream_update_goals_csv(_matches, _clear)
+    if not updated:
+        # The goal may only exist in sessions.csv so far; sync and retry once.
+        storage.load_goals_csv()
+        updated = storage.stream_update_goals_csv(_matches, _clear)
 
-    if not goal_found:
+    if not updated:
         print(f"Error: goal with title '{title}' not found")
         return 1
 
-    # Save the updated goals
-    storage.save_goals_csv(goals)
     print(f"Finished goal '{title}': cleared all fields except time worked")
     return 0
 
@@ -1,12 +1,13 @@
 import argparse
 import datetime as dt
 import os
-import select
-import shlex
+import re
+import selectors
 import sys
 import termios
+import time
 import tty
-from typing import Optional
+from dataclasses import dataclass
 
 from .. import config, storage
 from .. import messages as msgs
@@ -19,11 +20,13 @@ from .set import (
     DEFAULT_ESTIMATE_BAR,
 )
 
+_NS_PER_S = 1_000_000_000
+
 
 def _get_bar_width() -> int:
     # Get bar width from config (default: 42)
     try:
-        bar_width = int(config.get_config("bar_width", DEFAULT_BAR_WIDTH))
+        bar_width = config.get_config_int("bar_width", DEFAULT_BAR_WIDTH)
         if bar_width <= 0:
             bar_width = int(DEFAULT_BAR_WIDTH)
     except (ValueError, TypeError):
@@ -31,18 +34,57 @@ def _get_bar_width() -> int:
     return bar_width
 
 
+@dataclass
+class _SessionConfig:
+    """Display settings read once per running span of a fokus session."""
+
+    clock: str
+    # Length of the bar clock in seconds
+    clock_target_s: int
+    estimate_bar_enabled: bool
+    countdown_enabled: bool
+    bar_width: int
+
+
+def _load_session_config(goal_override: str | None) -> _SessionConfig:
+    """Read the display settings; a --goal forces the bar clock and its length."""
+    if goal_override:
+        clock = "bar"
+        clock_length = goal_override
+    else:
+        clock = config.get_config("clock", DEFAULT_CLOCK)
+        clock_length = config.get_config("clock_length", DEFAULT_CLOCK_LENGTH)
+    try:
+        clock_target_s = storage.parse_duration(clock_length)
+    except (ValueError, TypeError) as e:
+        # Fallback to 60 minutes if parsing fails
+        print(f"Error: invalid clock length '{clock_length}': {e}")
+        clock_target_s = 3600
+    return _SessionConfig(
+        clock=clock,
+        clock_target_s=clock_target_s,
+        estimate_bar_enabled=(
+            config.get_config("estimate_bar", DEFAULT_ESTIMATE_BAR).lower() == "true"
+        ),
+        countdown_enabled=(
+            config.get_config("countdown", DEFAULT_COUNTDOWN).lower() == "true"
+        ),
+        bar_width=_get_bar_width(),
+    )
+
+
 def _format_duration(seconds: int) -> str:
     return storage.format_hms(seconds)
 
 
 def _save_session_csv(
-    title: Optional[str], start: dt.datetime, end: dt.datetime, duration_s: int
+    title: str | None, start: dt.datetime, end: dt.datetime, duration_s: int
 ) -> str:
     return storage.save_session_csv(title or "", start, end, duration_s)
 
 
 def _handle_save(
-    title: Optional[str],
+    title: str | None,
     start: dt.datetime,
     end: dt.datetime,
     elapsed_s: int,
@@ -54,14 +96,21 @@ def _handle_save(
     print(msgs.saved_path_line(path))
 
 
-def _read_key_nonblocking(timeout_s: float = 0.0) -> Optional[str]:
-    rlist, _, _ = select.select([sys.stdin], [], [], timeout_s)
-    if not rlist:
+def _read_key_nonblocking(
+    sel: selectors.BaseSelector, timeout_s: float = 0.0
+) -> str | None:
+    """Return the keys typed so far, or None if none arrive within timeout_s.
+
+    sel must have sys.stdin registered for reading.
+    """
+    if not sel.select(timeout_s):
         return None
-    ch = os.read(sys.stdin.fileno(), 1)
-    if not ch:
+    # Drain everything queued in cbreak mode (pastes, key repeat) in one read,
+    # so the next select() only wakes up for new input
+    chunk = os.read(sys.stdin.fileno(), 64)
+    if not chunk:
         return None
-    return ch.decode(errors="ignore")
+    return chunk.decode(errors="ignore")
 
 
 def _set_raw_mode():
@@ -80,122 +129,154 @@ def _print_header(start_time: dt.datetime):
     print(msgs.started_at_line(start_time))
 
 
-def _tick_render(
+# What a progress line shows: filled cells, percent, label and the seconds
+# printed after the label
+_ProgressState = tuple[int, int, str, int]
+# Everything that determines a rendered frame; equal frames look identical
+_Frame = tuple[str, _ProgressState | None, _ProgressState | None]
+
+
+def _progress_state(
+    worked_s: int,
+    target_s: int,
+    cfg: _SessionConfig,
+    done_label: str,
+    goal_label: str,
+) -> _ProgressState:
+    """Return what a progress line for worked_s out of target_s shows."""
+    if worked_s >= target_s:
+        # Target reached or exceeded (also covers target_s <= 0)
+        return cfg.bar_width, 100, done_label, worked_s
+    # Integer floor division: exact, so cell/percent transitions are predictable
+    filled = worked_s * cfg.bar_width // target_s
+    percent = worked_s * 100 // target_s
+    if cfg.countdown_enabled:
+        return filled, percent, "remaining", target_s - worked_s
+    return filled, percent, goal_label, target_s
+
+
+def _progress_changes_in(worked_s: int, target_s: int, cfg: _SessionConfig) -> int:
+    """Return the seconds until _progress_state(worked_s, ...) next changes."""
+    if worked_s >= target_s or cfg.countdown_enabled:
+        # The time shown changes every second
+        return 1
+    filled = worked_s * cfg.bar_width // target_s
+    percent = worked_s * 100 // target_s
+    # First second at which each value increments (ceiling division)
+    next_filled = -(-(filled + 1) * target_s // cfg.bar_width)
+    next_percent = -(-(percent + 1) * target_s // 100)
+    return min(next_filled, next_percent, target_s) - worked_s
+
+
+def _estimate_progress(
     elapsed_s: int,
-    goal_override: Optional[str] = None,
-    session_title: Optional[str] = None,
-    is_first_render: bool = False,
-    estimate_seconds: Optional[int] = None,
-    time_worked_before: Optional[int] = None,
-):
-    clock = config.get_config("clock", DEFAULT_CLOCK)
-    if goal_override:
-        clock = "bar"
-
-    # Check if estimate bar is enabled
-    estimate_bar_enabled = (
-        config.get_config("estimate_bar", DEFAULT_ESTIMATE_BAR).lower() == "true"
-    )
-    countdown_enabled = (
-        config.get_config("countdown", DEFAULT_COUNTDOWN).lower() == "true"
-    )
-    estimate_line = None
-
-    # Render estimate bar if enabled and we have estimate data
+    cfg: _SessionConfig,
+    estimate_seconds: int | None,
+    time_worked_before: int | None,
+) -> tuple[int, int] | None:
+    """Return (worked, estimate) seconds for the estimate bar, or None if hidden."""
     if (
-        estimate_bar_enabled
+        cfg.estimate_bar_enabled
         and estimate_seconds is not None
         and estimate_seconds > 0
         and time_worked_before is not None
     ):
-        total_time_worked = time_worked_before + elapsed_s
-        progress = total_time_worked / estimate_seconds if estimate_seconds > 0 else 1.0
-
-        bar_width = _get_bar_width()
-
-        # Create progress bar (capped at 100%)
-        filled = min(int(progress * bar_width), bar_width)
-        bar = "█" * filled + "░" * (bar_width - filled)
-
-        # Show percentage and time remaining/completed
-        if total_time_worked >= estimate_seconds:
-            # Estimate reached or exceeded
-            estimate_line = (
-                f":>{bar} {int(min(progress, 1.0) * 100)}% "
-                f"(worked: {_format_duration(total_time_worked)})"
-            )
-        else:
-            if countdown_enabled:
-                remaining = estimate_seconds - total_time_worked
-                estimate_line = (
-                    f":>{bar} {int(progress * 100)}% "
-                    f"(remaining: {_format_duration(remaining)})"
-                )
-            else:
-                estimate_line = (
-                    f":>{bar} {int(progress * 100)}% "
-                    f"(estimate: {_format_duration(estimate_seconds)})"
-                )
+        return time_worked_before + elapsed_s, estimate_seconds
+    return None
 
-    # Render normal clock
-    if clock == "dots":
-        minutes = elapsed_s // 60
-        dots = "." * minutes
-        line = f":>{dots}" if dots else ":>"
-    elif clock == "bar":
-        # Parse target duration from goal override or clock_length config
-        if goal_override:
-            clock_length_str = goal_override
-        else:
-            clock_length_str = config.get_config("clock_length", DEFAULT_CLOCK_LENGTH)
-        try:
-            target_s = storage.parse_duration(clock_length_str)
-        except (ValueError, TypeError) as e:
-            # Fallback to 60 minutes if parsing fails
-            print(f"Error: invalid clock length '{clock_length_str}': {e}")
-            target_s = 3600
-
-        # Calculate progress (can exceed 1.0 if target is exceeded)
-        progress = elapsed_s / target_s if target_s > 0 else 1.0
-
-        bar_width = _get_bar_width()
-
-        # Create progress bar (capped at 100%)
-        filled = min(int(progress * bar_width), bar_width)
-        bar = "█" * filled + "░" * (bar_width - filled)
-
-        # Show percentage and time remaining/completed
-        if elapsed_s >= target_s:
-            # Target reached or exceeded
-            line = (
-                f":>{bar} {int(min(progress, 1.0) * 100)}% "
-                f"(total: {_format_duration(elapsed_s)})"
-            )
-        else:
-            if countdown_enabled:
-                remaining = target_s - elapsed_s
-                line = (
-                    f":>{bar} {int(progress * 100)}% "
-                    f"(remaining: {_format_duration(remaining)})"
-                )
-            else:
-                line = f":>{bar} {int(progress * 100)}% (goal: {_format_duration(target_s)})"
+
+def _format_progress(state: _ProgressState, cfg: _SessionConfig) -> str:
+    filled, percent, label, seconds = state
+    bar = storage.format_bar(cfg.bar_width, filled)
+    return f":>{bar} {percent}% ({label}: {_format_duration(seconds)})"
+
+
+def _tick_render(
+    elapsed_s: int,
+    cfg: _SessionConfig,
+    is_first_render: bool = False,
+    estimate_seconds: int | None = None,
+    time_worked_before: int | None = None,
+    last_frame: _Frame | None = None,
+) -> _Frame:
+    """Render the clock (and estimate bar) and return the rendered frame.
+
+    When the frame equals ``last_frame`` nothing is formatted or written; in
+    bar mode that is every tick until a cell or the percentage changes.
+    """
+    # Estimate bar if enabled and we have estimate data
+    estimate_state: _ProgressState | None = None
+    estimate = _estimate_progress(elapsed_s, cfg, estimate_seconds, time_worked_before)
+    if estimate is not None:
+        worked_s, target_s = estimate
+        estimate_state = _progress_state(worked_s, target_s, cfg, "worked", "estimate")
+
+    # Normal clock; the bar is only formatted once the frame is known to change
+    line = ""
+    clock_state: _ProgressState | None = None
+    if cfg.clock == "dots":
+        line = ":>" + "." * (elapsed_s // 60)
+    elif cfg.clock == "bar":
+        clock_state = _progress_state(
+            elapsed_s, cfg.clock_target_s, cfg, "total", "goal"
+        )
     else:
-        timer = _format_duration(elapsed_s)
-        line = f":>{timer}"
+        line = f":>{_format_duration(elapsed_s)}"
+
+    frame: _Frame = (line, clock_state, estimate_state)
+    if frame == last_frame:
+        return frame
+    if clock_state is not None:
+        line = _format_progress(clock_state, cfg)
 
     # Render both lines if estimate bar is shown
-    if estimate_line:
+    if estimate_state is not None:
+        estimate_line = _format_progress(estimate_state, cfg)
         if is_first_render:
             # First render: print both lines normally
-            print(f"{line}\n{estimate_line}\n", end="", flush=True)
+            output = f"{line}\n{estimate_line}\n"
         else:
             # Subsequent renders: move cursor up 2 lines and update both
             # Move up 2 lines, clear both lines, then print
-            print(f"\033[2A\r{line}\033[K\n{estimate_line}\033[K\n", end="", flush=True)
+            output = f"\033[2A\r{line}\033[K\n{estimate_line}\033[K\n"
     else:
         # No estimate bar: just render normal clock
-        print(f"\r{line}", end="", flush=True)
+        output = f"\r{line}"
+
+    _write_frame(output)
+    return frame
+
+
+def _write_frame(output: str) -> None:
+    """Write a rendered frame to the terminal with a single write() call."""
+    # Push out anything print() left in the text layer to keep ordering
+    sys.stdout.flush()
+    data = output.encode("utf-8")
+    fd = sys.stdout.fileno()
+    while data:
+        # A pty may accept only part of the frame; write the rest after it
+        data = data[os.write(fd, data) :]
+
+
+def _next_render_at(
+    elapsed_s: int,
+    cfg: _SessionConfig,
+    estimate_seconds: int | None = None,
+    time_worked_before: int | None = None,
+) -> int:
+    """Return the elapsed second at which the rendered frame next changes."""
+    if cfg.clock == "dots":
+        # Dots only grow once per full minute
+        step = 60 - elapsed_s % 60
+    elif cfg.clock == "bar":
+        step = _progress_changes_in(elapsed_s, cfg.clock_target_s, cfg)
+    else:
+        step = 1
+    estimate = _estimate_progress(elapsed_s, cfg, estimate_seconds, time_worked_before)
+    if estimate is not None:
+        worked_s, target_s = estimate
+        step = min(step, _progress_changes_in(worked_s, target_s, cfg))
+    return elapsed_s + step
 
 
 def _finalize_render() -> None:
@@ -203,30 +284,27 @@ def _finalize_render() -> None:
     print()
 
 
-def _parse_save_command(cmd_line: str) -> tuple[bool, Optional[str]]:
+# "--title" as its own token, followed by whitespace or "=", and its value
+_TITLE_FLAG_RE = re.compile(r"(?:^|\s)--title(?:\s+|=)(.*)$", re.IGNORECASE)
+
+
+def _parse_save_command(cmd_line: str) -> tuple[bool, str | None]:
+    """Parse 'save [--title TITLE]'; TITLE may be quoted or the rest of the line."""
     cmd_line = cmd_line.strip()
-    if not cmd_line.lower().startswith("save"):
+    if cmd_line[:4].lower() != "save":
         return False, None
 
-    # Try to parse with shlex to handle quoted strings properly
-    try:
-        parts = shlex.split(cmd_line)
-    except ValueError:
-        # Fallback to simple split if shlex fails
-        parts = cmd_line.split()
-
-    if len(parts) == 1 and parts[0].lower() == "save":
+    # A standalone --title flag, not a longer one such as --titles
+    match = _TITLE_FLAG_RE.search(cmd_line)
+    if match is None or not match.group(1):
         return True, None
 
-    # Look for --title flag
-    title = None
-    for i, part in enumerate(parts):
-        if part.lower() == "--title":
-            if i + 1 < len(parts):
-                title = parts[i + 1]
-            break
-
-    return True, title
+    rest = match.group(1)
+    if rest[:1] in ("'", '"'):
+        # Quoted title: up to the matching quote, or the end if unterminated
+        end = rest.find(rest[0], 1)
+        return True, rest[1:end] if end > 0 else rest[1:]
+    return True, rest
 
 
 def fokus_configure_parser(p: argparse.ArgumentParser) -> None:
@@ -246,7 +324,7 @@ def fokus_configure_parser(p: argparse.ArgumentParser) -> None:
 
 def fokus_run(args: argparse.Namespace) -> int:
     # Validate goal parameter if provided
-    goal_override: Optional[str] = None
+    goal_override: str | None = None
     if args.goal:
         try:
             # Validate the duration format
@@ -260,93 +338,93 @@ def fokus_run(args: argparse.Namespace) -> int:
     _print_header(start)
 
     # Load estimate data if estimate_bar is enabled and title is provided
-    estimate_seconds: Optional[int] = None
-    time_worked_before: Optional[int] = None
-    estimate_bar_enabled = (
-        config.get_config("estimate_bar", DEFAULT_ESTIMATE_BAR).lower() == "true"
-    )
-    if estimate_bar_enabled and args.title:
+    estimate_seconds: int | None = None
+    time_worked_before: int | None = None
+    # Read once per running span instead of on every tick; refreshed on resume.
+    session_cfg = _load_session_config(goal_override)
+    if session_cfg.estimate_bar_enabled and args.title:
         try:
-            goals = storage.load_goals_csv()
-            for goal in goals:
-                if goal.get("title") == args.title:
-                    est_sec = goal.get("estimate_seconds", 0)
-                    if isinstance(est_sec, int) and est_sec > 0:
-                        estimate_seconds = est_sec
-                        # Get time worked before this session
-                        estimate_timestamp = goal.get("estimate_timestamp")
-                        if isinstance(estimate_timestamp, dt.datetime):
-                            time_worked_before = storage.get_time_worked_for_title(
-                                args.title, after_timestamp=estimate_timestamp
-                            )
-                        else:
-                            time_worked_obj = goal.get("time_worked_seconds", 0)
-                            if isinstance(time_worked_obj, int):
-                                time_worked_before = time_worked_obj
-                            else:
-                                time_worked_before = 0
-                        break
-        except Exception as e:
+            goal = storage.load_goal_by_title(args.title)
+            if goal and goal.estimate_seconds > 0:
+                estimate_seconds = goal.estimate_seconds
+                # Get time worked before this session; goals.csv itself is not
+                # synced here, so always count from sessions.csv. Without an
+                # estimate timestamp this counts all time worked.
+                time_worked_before = storage.get_time_worked_for_title(
+                    args.title, after_timestamp=goal.estimate_timestamp
+                )
+        except Exception as e:  # noqa: BLE001
             # If loading goals fails, just continue without estimate bar
             print(f"Error: failed to load goals: {e}")
 
+    # The prompt only depends on the language, which cannot change mid-session
+    command_prompt = msgs.command_prompt()
+
     # Running: detect space with raw mode; Paused: line input for commands
     paused = False
     accumulated = 0  # seconds accumulated before current running span
-    run_started = dt.datetime.now()  # timestamp when the current running span began
-    pause_started: Optional[dt.datetime] = None
+    # Monotonic timestamps: elapsed time is immune to wall-clock jumps
+    run_started = time.monotonic_ns()  # when the current running span began
+    pause_started: int | None = None
     fd, old = _set_raw_mode()
+    # Register stdin once for the whole session (epoll/kqueue where available)
+    sel = selectors.DefaultSelector()
+    sel.register(sys.stdin, selectors.EVENT_READ)
 
     # Track if this is the first render (for estimate bar positioning)
     is_first_render = True
 
     # Initial render
-    _tick_render(
+    last_frame = _tick_render(
         0,
-        goal_override,
-        args.title,
+        session_cfg,
         is_first_render,
         estimate_seconds,
         time_worked_before,
     )
     is_first_render = False
+    next_render_at = _next_render_at(
+        0, session_cfg, estimate_seconds, time_worked_before
+    )
 
     try:
-        last_whole = -1
         while True:
-            now = dt.datetime.now()
+            # One clock read per iteration serves both elapsed and the timeout
+            now_ns = time.monotonic_ns()
             if paused:
                 elapsed = accumulated
             else:
-                elapsed = accumulated + int((now - run_started).total_seconds())
-
-            # Update display every second when running
-            if not paused:
-                if elapsed != last_whole:
-                    _tick_render(
-                        elapsed,
-                        goal_override,
-                        args.title,
-                        is_first_render,
-                        estimate_seconds,
-                        time_worked_before,
-                    )
-                    is_first_render = False
-                    last_whole = elapsed
-            elif paused and elapsed != last_whole:
-                # # When paused, always show normal time format
-                # _tick_render(elapsed, paused)
-                last_whole = elapsed
+                elapsed = accumulated + (now_ns - run_started) // _NS_PER_S
+
+            # Only re-render once the display would actually change
+            if not paused and elapsed >= next_render_at:
+                last_frame = _tick_render(
+                    elapsed,
+                    session_cfg,
+                    is_first_render,
+                    estimate_seconds,
+                    time_worked_before,
+                    last_frame,
+                )
+                is_first_render = False
+                next_render_at = _next_render_at(
+                    elapsed, session_cfg, estimate_seconds, time_worked_before
+                )
 
             if not paused:
-                key = _read_key_nonblocking(0.1)
-                if key is None:
+                # Sleep until input arrives or the next render is due
+                render_due = run_started + (next_render_at - accumulated) * _NS_PER_S
+                timeout = max(0, render_due - now_ns) / _NS_PER_S
+                keys = _read_key_nonblocking(sel, timeout)
+                if keys is None:
                     continue
-                if key == " ":
+                if " " in keys:
                     # accumulate time up to this pause moment
-                    accumulated += int((now - run_started).total_seconds())
+                    pause_started = time.monotonic_ns()
+                    accumulated += (pause_started - run_started) // _NS_PER_S
+                    elapsed = accumulated
+                    now = dt.datetime.now()
                     paused = True
-                    pause_started = now
                     _finalize_render()
                     _restore_mode(fd, old)
                     fd, old = None, None
@@ -356,7 +434,8 @@ def fokus_run(args: argparse.Namespace) -> int:
                     continue
             else:
                 # Paused: accept command lines
-                sys.stdout.write(msgs.command_prompt())
+                now = dt.datetime.now()
+                sys.stdout.write(command_prompt)
                 sys.stdout.flush()
                 line = sys.stdin.readline()
                 cmd = (line or "").strip()
@@ -380,28 +459,33 @@ def fokus_run(args: argparse.Namespace) -> int:
                     break
                 if cmd in ("resume", "continue", "r", ""):
                     resume_now = dt.datetime.now()
+                    resume_ns = time.monotonic_ns()
                     if pause_started is not None:
-                        pause_dur_s = int((resume_now - pause_started).total_seconds())
+                        pause_dur_s = (resume_ns - pause_started) // _NS_PER_S
                     else:
                         pause_dur_s = 0
                     # Delete the last line
                     print("\033[1A\033[K", end="", flush=True)
                     print(msgs.resuming_line(_format_duration(pause_dur_s), resume_now))
+                    # Pick up settings changed by `hiper set` while paused
+                    config.invalidate_cache()
+                    session_cfg = _load_session_config(goal_override)
                     fd, old = _set_raw_mode()
                     paused = False
-                    run_started = resume_now
+                    run_started = resume_ns
                     pause_started = None
-                    last_whole = -1
                     is_first_render = True
-                    _tick_render(
+                    last_frame = _tick_render(
                         elapsed,
-                        goal_override,
-                        args.title,
+                        session_cfg,
                         is_first_render,
                         estimate_seconds,
                         time_worked_before,
                     )
                     is_first_render = False
+                    next_render_at = _next_render_at(
+                        elapsed, session_cfg, estimate_seconds, time_worked_before
+                    )
                     continue
                 # Invalid command - only save, discard/cancel, and resume/continue are allowed
                 if cmd:
@@ -409,15 +493,15 @@ def fokus_run(args: argparse.Namespace) -> int:
                     continue
     except KeyboardInterrupt:
         _finalize_render()
-        now = dt.datetime.now()
         elapsed = (
             accumulated
             if paused
-            else accumulated + int((now - run_started).total_seconds())
+            else accumulated + (time.monotonic_ns() - run_started) // _NS_PER_S
         )
         print(msgs.interrupted_line(elapsed_seconds=elapsed))
 
     finally:
+        sel.close()
         _restore_mode(fd, old)
 
     return 0
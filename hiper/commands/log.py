@@ -1,9 +1,14 @@
 import argparse
 import datetime as dt
+import sys
 
 from .. import storage
 from . import Command
 
+# How far back past the --last cutoff log.csv is still scanned for entries
+# written out of order.
+_OUT_OF_ORDER_SLACK = dt.timedelta(days=1)
+
 
 def log_configure_parser(p: argparse.ArgumentParser) -> None:
     p.add_argument(
@@ -16,6 +21,11 @@ def log_configure_parser(p: argparse.ArgumentParser) -> None:
         "-l",
         help="Show logs from the last duration (e.g., 5m, 1h)",
     )
+    p.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Append each non-empty line read from stdin as a message",
+    )
 
 
 def _print_logs_since(duration: str) -> int:
@@ -27,21 +37,30 @@ def _print_logs_since(duration: str) -> int:
         return 1
 
     cutoff = dt.datetime.now() - dt.timedelta(seconds=seconds)
-    logs = storage.load_log_csv()
 
+    # Newest first. Timestamps are naive local times, so rows can be out of
+    # order by up to a clock shift (e.g. DST); stop only once an entry is
+    # older than the cutoff by more than _OUT_OF_ORDER_SLACK.
+    stop_before = cutoff - _OUT_OF_ORDER_SLACK
     recent: list[tuple[dt.datetime, str]] = []
-    for log in logs:
+    for log in storage.iter_log_csv_reverse():
         ts = log.get("timestamp")
-        if isinstance(ts, dt.datetime) and ts >= cutoff:
-            msg_obj = log.get("message", "")
-            msg = str(msg_obj) if msg_obj is not None else ""
-            recent.append((ts, msg))
+        if not isinstance(ts, dt.datetime):
+            continue
+        if ts < cutoff:
+            if ts < stop_before:
+                break
+            continue
+        msg_obj = log.get("message", "")
+        msg = str(msg_obj) if msg_obj is not None else ""
+        recent.append((ts, msg))
 
     if not recent:
         print(f"No logs found in the last {duration}")
         return 0
 
     # Sort by timestamp ascending
+    recent.reverse()
     recent.sort(key=lambda row: row[0])
 
     for ts, msg in recent:
@@ -50,10 +69,26 @@ def _print_logs_since(duration: str) -> int:
     return 0
 
 
+def _log_from_stdin() -> int:
+    """Append every non-empty stdin line as a message, in a single write."""
+    messages = [line.strip() for line in sys.stdin]
+    messages = [message for message in messages if message]
+    if not messages:
+        print("Error: no messages on stdin")
+        return 1
+
+    path, count = storage.append_log_csv_many(messages, dt.datetime.now())
+    print(f"Logged {count} messages to {path}")
+    return 0
+
+
 def log_run(args: argparse.Namespace) -> int:
     if args.last:
         return _print_logs_since(args.last)
 
+    if args.stdin:
+        return _log_from_stdin()
+
     message = str(args.message or "").strip()
     if not message:
         print("Error: message cannot be empty")
@@ -69,7 +104,8 @@ def get_command() -> Command:
         name="log",
         help="Append a message or view recent logs.",
         description="Append a message with the current timestamp to log.csv, "
-        "or list log entries from a recent duration with --last (e.g. 5m, 1h).",
+        "or list log entries from a recent duration with --last (e.g. 5m, 1h). "
+        "With --stdin, every non-empty input line is logged as its own message.",
         configure_parser=log_configure_parser,
         run=log_run,
     )
@@ -1,58 +1,57 @@
 import argparse
 import datetime as dt
-from typing import Dict, Optional
+import functools
+import heapq
+import re
+import sys
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
 
 from .. import messages as msgs
 from .. import storage
 from . import Command
 
+_HHMM_RE = re.compile(r"(\d{1,2}):(\d{1,2})(?::\d{1,2})?")
+
 
 def _parse_duration(s: str) -> int:
     return storage.parse_duration(s)
 
 
-def _get_duration(row: Dict[str, object]) -> int:
-    """Safely extract duration from a row dictionary."""
-    duration = row.get("duration", 0)
-    if isinstance(duration, int):
-        return duration
-    if isinstance(duration, str):
-        try:
-            return int(duration)
-        except ValueError:
-            return 0
-    return 0
-
+@functools.lru_cache(maxsize=512)
+def _parse_explicit(s: str, today: dt.date) -> dt.datetime:
+    """Parse an ISO datetime, or HH:MM on the given day.
 
-def _get_start(row: Dict[str, object]) -> Optional[dt.datetime]:
-    """Safely extract start datetime from a row dictionary."""
-    start = row.get("start")
-    if isinstance(start, dt.datetime):
-        return start
-    return None
-
-
-def _parse_start(s: Optional[str], duration_s: int) -> dt.datetime:
-    if not s:
-        # default: end now, infer start
-        end = dt.datetime.now()
-        return end - dt.timedelta(seconds=duration_s)
-    s = s.strip()
+    Keyed on the day as well, so cached HH:MM results never outlive it.
+    """
     # Try ISO first
     try:
         return dt.datetime.fromisoformat(s)
-    except Exception:
-        pass
-    # Try HH:MM today
-    try:
-        hh, mm, *_ = s.split(":")
-        now = dt.datetime.now()
-        return now.replace(hour=int(hh), minute=int(mm), second=0, microsecond=0)
-    except Exception:
+    except ValueError:
         pass
+    # Try HH:MM (seconds, if given, are dropped) on that day
+    m = _HHMM_RE.fullmatch(s)
+    if m:
+        try:
+            return dt.datetime.combine(today, dt.time(int(m[1]), int(m[2])))
+        except ValueError:
+            # Hour or minute out of range
+            pass
     raise ValueError("start must be ISO datetime or HH:MM")
 
 
+def _parse_start(
+    s: str | None, duration_s: int, now: dt.datetime | None = None
+) -> dt.datetime:
+    if now is None:
+        now = dt.datetime.now()
+    if not s:
+        # default: end now, infer start
+        return now - dt.timedelta(seconds=duration_s)
+    return _parse_explicit(s.strip(), now.date())
+
+
 def postfokus_configure_parser(p: argparse.ArgumentParser) -> None:
     p.add_argument(
         "--duration",
@@ -80,6 +79,12 @@ def postfokus_configure_parser(p: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Show per-title breakdown",
     )
+    p.add_argument(
+        "--top",
+        type=int,
+        default=None,
+        help="With --titles, only show the N titles with the most time.",
+    )
     p.add_argument(
         "--since",
         help="Only include sessions starting on/after this date (YYYY-MM-DD).",
@@ -90,171 +95,213 @@ def postfokus_configure_parser(p: argparse.ArgumentParser) -> None:
     )
 
 
-def _filter_rows_range(
-    rows: list[Dict[str, object]],
-    since: Optional[dt.date],
-    until: Optional[dt.date],
-) -> list[Dict[str, object]]:
-    filtered: list[Dict[str, object]] = []
-    for r in rows:
-        start = _get_start(r)
-        if start is None:
-            continue
-        start_date = start.date()
-        if since is not None and start_date < since:
-            continue
-        if until is not None and start_date > until:
-            continue
-        filtered.append(r)
-    return filtered
-
-
-def _parse_since(since_str: Optional[str]) -> Optional[dt.date]:
+def _parse_since(since_str: str | None) -> dt.date | None:
     if not since_str:
         return None
     try:
-        return dt.datetime.strptime(since_str.strip(), "%Y-%m-%d").date()
-    except Exception:
+        return storage.parse_date(since_str.strip())
+    except ValueError:
         raise ValueError("since must be YYYY-MM-DD")
 
 
-def _parse_until(until_str: Optional[str]) -> Optional[dt.date]:
+def _parse_until(until_str: str | None) -> dt.date | None:
     if not until_str:
         return None
     try:
-        return dt.datetime.strptime(until_str.strip(), "%Y-%m-%d").date()
-    except Exception:
+        return storage.parse_date(until_str.strip())
+    except ValueError:
         raise ValueError("until must be YYYY-MM-DD")
 
 
-def _print_statistics(
-    title_filter: Optional[str] = None,
-    since: Optional[dt.date] = None,
-    until: Optional[dt.date] = None,
-) -> int:
-    rows = storage.load_sessions_csv()
-    if title_filter:
-        rows = [r for r in rows if (r.get("title") or "") == title_filter]
-    rows = _filter_rows_range(rows, since, until)
-    print(msgs.stats_header(title_filter))
-    if not rows:
-        print(msgs.stats_line("sessions", "0"))
-        return 0
-    total_sessions = len(rows)
-    total_seconds = sum(_get_duration(r) for r in rows)
-    now = dt.datetime.now()
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+@dataclass
+class _Totals:
+    """Session count and summed durations (seconds) over the aggregated rows."""
+
+    sessions: int
+    total: int
+    today: int
+    last7: int
+    last30: int
+    # Windows for the per-day averages: the last 7/30 days up to today
+    window7: int
+    window30: int
+    earliest: dt.datetime | None
+
+
+def _aggregate(
+    rows: Iterable[storage.Session],
+    today_start: dt.datetime,
+    by_title: bool = False,
+    title_filter: str | None = None,
+    since: dt.date | None = None,
+    until: dt.date | None = None,
+) -> tuple[dict[str, list[int]], _Totals]:
+    """Filter and aggregate rows in a single pass.
+
+    Only rows titled exactly title_filter (if given) and starting within
+    since..until (inclusive dates, if given) are counted. Returns the totals
+    and, with by_title, a {title: [sessions, seconds]} breakdown in order of
+    first appearance (empty otherwise).
+    """
+    # Bounds as datetimes, so no row needs .date(): start.date() >= since iff
+    # start >= since at midnight, and start.date() <= until iff start is
+    # before midnight of the following day.
+    lower = dt.datetime.combine(since, dt.time.min) if since is not None else None
+    upper = (
+        dt.datetime.combine(until + dt.timedelta(days=1), dt.time.min)
+        if until is not None
+        else None
+    )
+    tomorrow_start = today_start + dt.timedelta(days=1)
     last7_start = today_start - dt.timedelta(days=6)
     last30_start = today_start - dt.timedelta(days=29)
-    today_seconds = sum(
-        _get_duration(r)
-        for r in rows
-        if (start := _get_start(r)) is not None and start >= today_start
-    )
-    week_seconds = sum(
-        _get_duration(r)
-        for r in rows
-        if (start := _get_start(r)) is not None and start >= last7_start
+
+    # The day windows for the averages end with today, i.e. before
+    # tomorrow_start, so future sessions count towards "last N days" but not
+    # towards the per-day averages.
+    agg: defaultdict[str, list[int]] = defaultdict(lambda: [0, 0])
+    sessions = total = today = last7 = last30 = window7 = window30 = 0
+    earliest: dt.datetime | None = None
+    for r in rows:
+        start = r.start
+        if lower is not None and start < lower:
+            continue
+        if upper is not None and start >= upper:
+            continue
+        if title_filter is not None and r.title != title_filter:
+            continue
+        duration = r.duration
+        sessions += 1
+        if by_title:
+            entry = agg[r.title.strip()]
+            entry[0] += 1
+            entry[1] += duration
+        total += duration
+        if earliest is None or start < earliest:
+            earliest = start
+        if start < last30_start:
+            continue
+        last30 += duration
+        if start < tomorrow_start:
+            window30 += duration
+        if start >= last7_start:
+            last7 += duration
+            if start < tomorrow_start:
+                window7 += duration
+            if start >= today_start:
+                today += duration
+
+    totals = _Totals(
+        sessions=sessions,
+        total=total,
+        today=today,
+        last7=last7,
+        last30=last30,
+        window7=window7,
+        window30=window30,
+        earliest=earliest,
     )
-    month_seconds = sum(
-        _get_duration(r)
-        for r in rows
-        if (start := _get_start(r)) is not None and start >= last30_start
+    return agg, totals
+
+
+def _today_start(now: dt.datetime | None = None) -> dt.datetime:
+    if now is None:
+        now = dt.datetime.now()
+    return now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _print_statistics(
+    title_filter: str | None = None,
+    since: dt.date | None = None,
+    until: dt.date | None = None,
+    now: dt.datetime | None = None,
+) -> int:
+    # Stream sessions.csv straight into the aggregation; no rows are kept
+    today_start = _today_start(now)
+    _, totals = _aggregate(
+        storage.iter_sessions_csv(),
+        today_start,
+        title_filter=title_filter or None,
+        since=since,
+        until=until,
     )
-    avg_seconds = total_seconds // total_sessions if total_sessions else 0
-    print("--------------------------------")
-    print(msgs.stats_line("sessions", str(total_sessions)))
-    print(msgs.stats_line("total", storage.format_hms(total_seconds)))
-    print(msgs.stats_line("today", storage.format_hms(today_seconds)))
-    print(msgs.stats_line("last 7 days", storage.format_hms(week_seconds)))
-    print(msgs.stats_line("last 30 days", storage.format_hms(month_seconds)))
+    header = msgs.stats_header(title_filter)
+    if not totals.sessions:
+        print(header)
+        print(msgs.stats_line("sessions", "0"))
+        return 0
+
+    total_seconds = totals.total
+    avg_seconds = total_seconds // totals.sessions if totals.sessions else 0
     # Averages per day (including today)
-    min_date = None
-    for r in rows:
-        start = _get_start(r)
-        if start is None:
-            continue
-        start_date = start.date()
-        if min_date is None or start_date < min_date:
-            min_date = start_date
+    min_date = totals.earliest.date() if totals.earliest else None
     days_total = (today_start.date() - min_date).days + 1 if min_date else 0
     avg_per_day_all = total_seconds // days_total if days_total > 0 else 0
+    avg_per_day_last7 = totals.window7 // 7
+    avg_per_day_last30 = totals.window30 // 30
 
-    def _avg_window(
-        start_date: dt.date, end_date: dt.date, rows_subset: list[Dict[str, object]]
-    ) -> int:
-        span_days = (end_date - start_date).days + 1
-        if span_days <= 0:
-            return 0
-        window_total = sum(_get_duration(r) for r in rows_subset)
-        return window_total // span_days
-
-    window_start_7 = last7_start.date()
-    window_rows_7 = [
-        r
-        for r in rows
-        if (start := _get_start(r)) is not None
-        and start.date() >= window_start_7
-        and start.date() <= today_start.date()
-    ]
-    avg_per_day_last7 = _avg_window(window_start_7, today_start.date(), window_rows_7)
-
-    window_start_30 = last30_start.date()
-    window_rows_30 = [
-        r
-        for r in rows
-        if (start := _get_start(r)) is not None
-        and start.date() >= window_start_30
-        and start.date() <= today_start.date()
-    ]
-    avg_per_day_last30 = _avg_window(
-        window_start_30, today_start.date(), window_rows_30
-    )
-
-    print(msgs.stats_line("average per day", storage.format_hms(avg_per_day_all)))
-    print(
+    # Build the whole report and write it once
+    out = [
+        header,
+        "--------------------------------",
+        msgs.stats_line("sessions", str(totals.sessions)),
+        msgs.stats_line("total", storage.format_hms(total_seconds)),
+        msgs.stats_line("today", storage.format_hms(totals.today)),
+        msgs.stats_line("last 7 days", storage.format_hms(totals.last7)),
+        msgs.stats_line("last 30 days", storage.format_hms(totals.last30)),
+        msgs.stats_line("average per day", storage.format_hms(avg_per_day_all)),
         msgs.stats_line(
             "average per day last 7 days",
             storage.format_hms(avg_per_day_last7),
-        )
-    )
-    print(
+        ),
         msgs.stats_line(
             "average per day last 30 days",
             storage.format_hms(avg_per_day_last30),
-        )
-    )
-    print(msgs.stats_line("average session length", storage.format_hms(avg_seconds)))
+        ),
+        msgs.stats_line("average session length", storage.format_hms(avg_seconds)),
+    ]
+    sys.stdout.write("\n".join(out) + "\n")
     return 0
 
 
 def _print_statistics_by_title(
-    since: Optional[dt.date] = None, until: Optional[dt.date] = None
+    since: dt.date | None = None,
+    until: dt.date | None = None,
+    top: int | None = None,
+    now: dt.datetime | None = None,
 ) -> int:
-    rows = storage.load_sessions_csv()
-    rows = _filter_rows_range(rows, since, until)
-    print(msgs.stats_header("by title"))
-    if not rows:
+    agg, totals = _aggregate(
+        storage.iter_sessions_csv(),
+        _today_start(now),
+        by_title=True,
+        since=since,
+        until=until,
+    )
+    header = msgs.stats_header("by title")
+    if not totals.sessions:
+        print(header)
         print(msgs.stats_line("sessions", "0"))
         return 0
-    agg: Dict[str, Dict[str, int]] = {}
-    for r in rows:
-        title_str = r.get("title")
-        title = str(title_str).strip() if title_str else ""
-        entry = agg.setdefault(title, {"sessions": 0, "total": 0})
-        entry["sessions"] += 1
-        entry["total"] += _get_duration(r)
-    items = sorted(agg.items(), key=lambda kv: kv[1]["total"], reverse=True)
-    for title, data in items:
+    if top is not None and top < len(agg):
+        # Same order as the full sort, without sorting every title
+        items = heapq.nlargest(top, agg.items(), key=lambda kv: kv[1][1])
+    else:
+        items = sorted(agg.items(), key=lambda kv: kv[1][1], reverse=True)
+    out = [header]
+    for title, (sessions, total) in items:
         label = title if title else "(unnamed)"
-        print("--------------------------------")
-        print(msgs.stats_line(f"{label} sessions", str(data["sessions"])))
-        print(msgs.stats_line(f"{label} total", storage.format_hms(data["total"])))
-    print("--------------------------------")
+        out.append("--------------------------------")
+        out.append(msgs.stats_line(f"{label} sessions", str(sessions)))
+        out.append(msgs.stats_line(f"{label} total", storage.format_hms(total)))
+    out.append("--------------------------------")
+    sys.stdout.write("\n".join(out) + "\n")
     return 0
 
 
 def postfokus_run(args: argparse.Namespace) -> int:
+    # One clock reading for the whole command, so "today" and the inferred
+    # start/end all agree even when the command straddles midnight
+    now = dt.datetime.now()
     try:
         since_date = _parse_since(args.since)
         until_date = _parse_until(args.until)
@@ -262,35 +309,39 @@ def postfokus_run(args: argparse.Namespace) -> int:
         print(msgs.invalid_X(str(e), "since"))
         return 2
 
+    if args.top is not None and args.top <= 0:
+        print(msgs.invalid_X("must be a positive number", "top"))
+        return 2
+
     if not args.duration:
         # No duration -> show statistics
         if args.titles and not args.title:
-            return _print_statistics_by_title(since_date, until_date)
-        return _print_statistics(args.title or None, since_date, until_date)
+            return _print_statistics_by_title(since_date, until_date, args.top, now)
+        return _print_statistics(args.title or None, since_date, until_date, now)
     try:
         duration_s = _parse_duration(args.duration)
-    except Exception as e:
+    except ValueError as e:
         print(msgs.invalid_X(str(e), "duration"))
         return 2
     # Parse optional end first if provided
-    end: Optional[dt.datetime] = None
+    end: dt.datetime | None = None
     if args.end:
         try:
             # Reuse start parser semantics (ISO or HH:MM today)
-            end = _parse_start(args.end, duration_s)
-        except Exception as e:
+            end = _parse_start(args.end, duration_s, now)
+        except (ValueError, OverflowError) as e:
             print(msgs.invalid_X(str(e), "end"))
             return 2
     # Parse or infer start
     try:
         if args.start:
-            start = _parse_start(args.start, duration_s)
+            start = _parse_start(args.start, duration_s, now)
         else:
             if end is not None:
                 start = end - dt.timedelta(seconds=duration_s)
             else:
-                start = _parse_start(None, duration_s)
-    except Exception as e:
+                start = _parse_start(None, duration_s, now)
+    except (ValueError, OverflowError) as e:
         print(msgs.invalid_X(str(e), "start"))
         return 2
     # Infer end if not provided
@@ -1,16 +1,27 @@
 import argparse
 import datetime as dt
-from typing import Dict, List, Optional
+import functools
+import sys
+from dataclasses import dataclass
 
 from .. import config, storage
 from . import Command
 from .set import DEFAULT_WORK_PER_DAY
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_work_day(work_per_day: str) -> int:
+    return storage.parse_duration(work_per_day)
+
+
 def _get_seconds_per_work_day() -> int:
-    """Read configured work-per-day duration (defaults to 8h)."""
+    """Read configured work-per-day duration (defaults to 8h).
+
+    config caches its reads, and the parse is cached per value, so calling
+    this once per goal costs a couple of lookups.
+    """
     work_per_day = config.get_config("work_per_day", DEFAULT_WORK_PER_DAY)
-    return storage.parse_duration(work_per_day)
+    return _parse_work_day(work_per_day)
 
 
 def _calculate_start_by(
@@ -21,10 +32,10 @@ def _calculate_start_by(
     Deadline day is not workable. We can work 8 hours per day.
     """
     remaining_seconds = estimate_seconds - time_worked_seconds
-    seconds_per_day = _get_seconds_per_work_day()
     if remaining_seconds <= 0:
         # Already done, start immediately
         return dt.date.today()
+    seconds_per_day = _get_seconds_per_work_day()
 
     # Calculate days needed (ceiling division)
     days_needed = (remaining_seconds + seconds_per_day - 1) // seconds_per_day
@@ -44,88 +55,92 @@ def _calculate_start_by(
     return start_by
 
 
-def _update_time_worked(goals: List[Dict[str, object]]) -> List[Dict[str, object]]:
-    """Update time_worked_seconds for all goals based on current sessions.csv."""
+def _update_time_worked(goals: list[storage.Goal]) -> list[storage.Goal]:
+    """Update time_worked_seconds for all goals based on current sessions.csv.
+
+    sessions.csv is read once for all goals.
+    """
+    worked = storage.get_time_worked_by_title()
     for goal in goals:
-        title_obj = goal.get("title")
-        if not isinstance(title_obj, str):
-            continue
-        goal["time_worked_seconds"] = storage.get_time_worked_for_title(title_obj)
+        goal.time_worked_seconds = worked.get(goal.title.strip(), (0, 0))[0]
         # Recalculate start_by with updated time_worked
-        estimate_obj = goal.get("estimate_seconds")
-        deadline_obj = goal.get("deadline")
-        time_worked_obj = goal.get("time_worked_seconds", 0)
-
-        if (
-            isinstance(estimate_obj, int)
-            and estimate_obj > 0
-            and isinstance(deadline_obj, dt.date)
-            and isinstance(time_worked_obj, int)
-        ):
-            goal["start_by"] = _calculate_start_by(
-                estimate_obj,
-                deadline_obj,
-                time_worked_obj,
+        if goal.estimate_seconds > 0 and goal.deadline is not None:
+            goal.start_by = _calculate_start_by(
+                goal.estimate_seconds,
+                goal.deadline,
+                goal.time_worked_seconds,
             )
     return goals
 
 
-def build_goal_summary(goal: Dict[str, object]) -> Optional[Dict[str, object]]:
+@dataclass(slots=True)
+class GoalSummary:
+    """A goal's figures for listing, with time worked taken from sessions.csv.
+
+    The formatted fields (estimate, remaining) are "" when there is no
+    estimate.
+    """
+
+    title: str
+    estimate_seconds: int
+    estimate: str
+    time_worked_seconds: int
+    time_worked: str
+    total_time_worked_seconds: int
+    total_time_worked: str
+    remaining_seconds: int
+    remaining: str
+    deadline: dt.date | None
+    start_by: dt.date | None
+
+
+def build_goal_summary(goal: storage.Goal) -> GoalSummary | None:
     """Return a normalized goal summary for listing."""
-    title_obj = goal.get("title")
-    if not isinstance(title_obj, str) or not title_obj:
+    title = goal.title
+    if not title:
         return None
 
-    estimate_seconds_obj = goal.get("estimate_seconds", 0)
-    estimate_seconds = (
-        estimate_seconds_obj if isinstance(estimate_seconds_obj, int) else 0
+    estimate_seconds = goal.estimate_seconds
+    # Counts from the estimate timestamp, or all time without one
+    time_worked_seconds = storage.get_time_worked_for_title(
+        title, after_timestamp=goal.estimate_timestamp
+    )
+    total_time_worked_seconds = storage.get_time_worked_for_title(title)
+    remaining_seconds = (
+        max(0, estimate_seconds - time_worked_seconds) if estimate_seconds > 0 else 0
     )
 
-    estimate_timestamp = goal.get("estimate_timestamp")
-    if isinstance(estimate_timestamp, dt.datetime):
-        time_worked_seconds = storage.get_time_worked_for_title(
-            title_obj, after_timestamp=estimate_timestamp
-        )
-    else:
-        time_worked_seconds = storage.get_time_worked_for_title(title_obj)
+    deadline = goal.deadline
+    start_by = goal.start_by
+    if deadline is not None and estimate_seconds > 0:
+        start_by = _calculate_start_by(estimate_seconds, deadline, time_worked_seconds)
+
+    return GoalSummary(
+        title=title,
+        estimate_seconds=estimate_seconds,
+        estimate=storage.format_hms(estimate_seconds) if estimate_seconds > 0 else "",
+        time_worked_seconds=time_worked_seconds,
+        time_worked=storage.format_hms(time_worked_seconds),
+        total_time_worked_seconds=total_time_worked_seconds,
+        total_time_worked=storage.format_hms(total_time_worked_seconds),
+        remaining_seconds=remaining_seconds,
+        remaining=storage.format_hms(remaining_seconds) if estimate_seconds > 0 else "",
+        deadline=deadline,
+        start_by=start_by,
+    )
 
-    deadline_obj = goal.get("deadline")
-    start_by_obj = goal.get("start_by")
-    if isinstance(deadline_obj, dt.date) and estimate_seconds > 0:
-        start_by_obj = _calculate_start_by(
-            estimate_seconds, deadline_obj, time_worked_seconds
-        )
-    else:
-        start_by_obj = start_by_obj if isinstance(start_by_obj, dt.date) else None
-
-    return {
-        "title": title_obj,
-        "estimate_seconds": estimate_seconds,
-        "estimate": storage.format_hms(estimate_seconds)
-        if estimate_seconds > 0
-        else "",
-        "time_worked_seconds": time_worked_seconds,
-        "time_worked": storage.format_hms(time_worked_seconds),
-        "remaining": storage.format_hms(max(0, estimate_seconds - time_worked_seconds))
-        if estimate_seconds > 0
-        else "",
-        "deadline": deadline_obj if isinstance(deadline_obj, dt.date) else None,
-        "start_by": start_by_obj if isinstance(start_by_obj, dt.date) else None,
-    }
-
-
-def _list_goals(goals: List[Dict[str, object]], show_all: bool) -> int:
-    # Pair the original goal dict with its summary so we can sort and still
+
+def _list_goals(goals: list[storage.Goal], show_all: bool) -> int:
+    # Pair the original goal with its summary so we can sort and still
     # reuse the detailed printer.
-    summaries: List[tuple[Dict[str, object], Dict[str, object]]] = []
+    summaries: list[tuple[GoalSummary, storage.Goal]] = []
     for goal in goals:
+        if not show_all and goal.estimate_seconds <= 0:
+            # Skip goals without an estimate before building their summary
+            continue
         built = build_goal_summary(goal)
         if not built:
             continue
-        if not show_all:
-            est = built.get("estimate_seconds")
-            if not (isinstance(est, int) and est > 0):
-                continue
         summaries.append((built, goal))
 
     if not summaries:
@@ -139,106 +154,97 @@ def _list_goals(goals: List[Dict[str, object]], show_all: bool) -> int:
     summaries = sorted(
         summaries,
         key=lambda pair: (
-            pair[0]["start_by"] if pair[0].get("start_by") else dt.date.max,
-            pair[0]["deadline"] if pair[0].get("deadline") else dt.date.max,
-            pair[0]["title"],
+            pair[0].start_by or dt.date.max,
+            pair[0].deadline or dt.date.max,
+            pair[0].title,
         ),
     )
 
-    header = "All goals:" if show_all else "Goals with current estimates:"
-    print(header)
+    # Build the whole listing and write it once
+    out = ["All goals:" if show_all else "Goals with current estimates:"]
     if show_all:
         # Original compact one-line style for --all
         for summary, _goal in summaries:
             parts = [
-                f"{summary['title']}",
-                f"estimate {summary['estimate']}"
-                if summary.get("estimate")
+                summary.title,
+                f"estimate {summary.estimate}"
+                if summary.estimate
                 else "estimate (not set)",
-                f"worked {summary['time_worked']}",
-                f"remaining {summary['remaining']}"
-                if summary.get("remaining")
+                f"worked {summary.time_worked}",
+                f"remaining {summary.remaining}"
+                if summary.remaining
                 else "remaining (n/a)",
             ]
-            deadline_obj = summary.get("deadline")
-            if isinstance(deadline_obj, dt.date):
-                parts.append(f"deadline {deadline_obj.strftime('%Y-%m-%d')}")
-            start_by_obj = summary.get("start_by")
-            if isinstance(start_by_obj, dt.date):
-                parts.append(f"start by {start_by_obj.strftime('%Y-%m-%d')}")
-            print("  - " + ", ".join(parts))
+            if summary.deadline is not None:
+                parts.append(f"deadline {summary.deadline.isoformat()}")
+            if summary.start_by is not None:
+                parts.append(f"start by {summary.start_by.isoformat()}")
+            out.append("  - " + ", ".join(parts))
     else:
         # Detailed block for goals with current estimates
         for idx, (summary, goal) in enumerate(summaries):
-            title = summary["title"] if isinstance(summary["title"], str) else ""
-            _print_goal_details(title, goal)
-            if idx < len(summaries) - 1:
-                print()
+            if idx:
+                out.append("")
+            out.extend(_goal_details_lines(summary.title, goal, summary))
+    sys.stdout.write("\n".join(out) + "\n")
 
     return 0
 
 
-def _print_goal_details(title: str, goal: Dict[str, object]) -> None:
-    summary = build_goal_summary(goal)
+def _goal_details_lines(
+    title: str,
+    goal: storage.Goal,
+    summary: GoalSummary | None = None,
+) -> list[str]:
+    """Return the detail block for a goal, one line per item.
 
-    # Totals
-    total_time_worked_seconds = storage.get_time_worked_for_title(title)
-    total_time_worked = storage.format_hms(total_time_worked_seconds)
-
-    estimate_timestamp = goal.get("estimate_timestamp")
-    if isinstance(estimate_timestamp, dt.datetime):
-        time_worked_seconds = storage.get_time_worked_for_title(
-            title, after_timestamp=estimate_timestamp
-        )
+    summary is build_goal_summary(goal) when the caller already has it.
+    """
+    if summary is None:
+        summary = build_goal_summary(goal)
+
+    # Totals; the summary's time worked already counts from the estimate
+    # timestamp, if any
+    estimate_timestamp = goal.estimate_timestamp
+    if summary:
+        total_time_worked = summary.total_time_worked
+        time_worked = summary.time_worked
     else:
-        time_worked_seconds_obj = summary.get("time_worked_seconds") if summary else 0
-        time_worked_seconds = (
-            time_worked_seconds_obj if isinstance(time_worked_seconds_obj, int) else 0
+        total_time_worked = storage.format_hms(storage.get_time_worked_for_title(title))
+        time_worked = storage.format_hms(
+            storage.get_time_worked_for_title(title, after_timestamp=estimate_timestamp)
+            if estimate_timestamp is not None
+            else 0
         )
-    time_worked = storage.format_hms(time_worked_seconds)
 
-    print(f"Goal: {title}")
-    print(f"  Total time worked: {total_time_worked}")
-    if isinstance(estimate_timestamp, dt.datetime):
-        print(f"  Time worked (after estimate): {time_worked}")
+    lines = [f"Goal: {title}", f"  Total time worked: {total_time_worked}"]
+    if estimate_timestamp is not None:
+        lines.append(f"  Time worked (after estimate): {time_worked}")
     else:
-        print(f"  Time worked: {time_worked}")
-
-    if not summary:
-        print("  Estimate: (not set)")
-        print("  Deadline: (not set)")
-        print("  Start by: (not set)")
-        return
-
-    estimate_obj = summary.get("estimate_seconds", 0)
-    deadline_obj = summary.get("deadline")
-    start_by_obj = summary.get("start_by")
-
-    if isinstance(estimate_obj, int) and estimate_obj > 0:
-        estimate = storage.format_hms(estimate_obj)
-        remaining_seconds = max(0, int(estimate_obj) - int(time_worked_seconds))
-        remaining = storage.format_hms(remaining_seconds)
-
-        print(f"  Estimate: {estimate}")
-        if remaining_seconds > 0:
-            print(f"  Remaining: {remaining}")
-        else:
-            print("  Remaining: 0 (completed!)")
-
-        if isinstance(deadline_obj, dt.date):
-            print(f"  Deadline: {deadline_obj.strftime('%Y-%m-%d')}")
-            if isinstance(start_by_obj, dt.date):
-                start_by_str = start_by_obj.strftime("%Y-%m-%d")
-                print(f"  Start by: {start_by_str} morning")
-            else:
-                print("  Start by: (not calculated)")
+        lines.append(f"  Time worked: {time_worked}")
+
+    if not summary or summary.estimate_seconds <= 0:
+        lines.append("  Estimate: (not set)")
+        lines.append("  Deadline: (not set)")
+        lines.append("  Start by: (not set)")
+        return lines
+
+    lines.append(f"  Estimate: {summary.estimate}")
+    if summary.remaining_seconds:
+        lines.append(f"  Remaining: {summary.remaining}")
+    else:
+        lines.append("  Remaining: 0 (completed!)")
+
+    if summary.deadline is not None:
+        lines.append(f"  Deadline: {summary.deadline.isoformat()}")
+        if summary.start_by is not None:
+            lines.append(f"  Start by: {summary.start_by.isoformat()} morning")
         else:
-            print("  Deadline: (not set)")
-            print("  Start by: (not set - deadline required)")
+            lines.append("  Start by: (not calculated)")
     else:
-        print("  Estimate: (not set)")
-        print("  Deadline: (not set)")
-        print("  Start by: (not set)")
+        lines.append("  Deadline: (not set)")
+        lines.append("  Start by: (not set - deadline required)")
+    return lines
 
 
 def prefokus_configure_parser(p: argparse.ArgumentParser) -> None:
@@ -281,9 +287,9 @@ def prefokus_run(args: argparse.Namespace) -> int:
     goals = storage.load_goals_csv()
 
     # Find existing goal or create new one
-    goal: Optional[Dict[str, object]] = None
+    goal: storage.Goal | None = None
     for g in goals:
-        if g["title"] == title:
+        if g.title == title:
             goal = g
             break
 
@@ -299,10 +305,10 @@ def prefokus_run(args: argparse.Namespace) -> int:
             print(f"Error: invalid estimate '{args.estimate}': {e}")
             return 1
 
-        deadline: Optional[dt.date] = None
+        deadline: dt.date | None = None
         if args.deadline:
             try:
-                deadline = dt.datetime.strptime(args.deadline, "%Y-%m-%d").date()
+                deadline = storage.parse_date(args.deadline)
             except ValueError:
                 print(
                     f"Error: invalid deadline format '{args.deadline}'. Use YYYY-MM-DD"
@@ -315,84 +321,65 @@ def prefokus_run(args: argparse.Namespace) -> int:
         time_worked_seconds = storage.get_time_worked_for_title(
             title, after_timestamp=estimate_timestamp
         )
-        start_by: Optional[dt.date] = None
+        start_by: dt.date | None = None
         if deadline:
             start_by = _calculate_start_by(
                 estimate_seconds, deadline, time_worked_seconds
             )
 
-        goal = {
-            "title": title,
-            "estimate_seconds": estimate_seconds,
-            "estimate_formatted": storage.format_hms(estimate_seconds),
-            "estimate_timestamp": estimate_timestamp,
-            "deadline": deadline,
-            "time_worked_seconds": time_worked_seconds,
-            "time_worked_formatted": storage.format_hms(time_worked_seconds),
-            "start_by": start_by,
-        }
+        goal = storage.Goal(
+            title=title,
+            estimate_seconds=estimate_seconds,
+            estimate_formatted=storage.format_hms(estimate_seconds),
+            estimate_timestamp=estimate_timestamp,
+            deadline=deadline,
+            time_worked_seconds=time_worked_seconds,
+            time_worked_formatted=storage.format_hms(time_worked_seconds),
+            start_by=start_by,
+        )
         goals.append(goal)
     else:
         # Update existing goal
         if args.estimate:
             try:
-                goal["estimate_seconds"] = storage.parse_duration(args.estimate)
-                goal["estimate_formatted"] = storage.format_hms(
-                    goal["estimate_seconds"]
-                )
+                goal.estimate_seconds = storage.parse_duration(args.estimate)
+                goal.estimate_formatted = storage.format_hms(goal.estimate_seconds)
                 # Set new timestamp when estimate is updated
-                goal["estimate_timestamp"] = dt.datetime.now()
+                goal.estimate_timestamp = dt.datetime.now()
             except ValueError as e:
                 print(f"Error: invalid estimate '{args.estimate}': {e}")
                 return 1
 
         if args.deadline:
             try:
-                goal["deadline"] = dt.datetime.strptime(
-                    args.deadline, "%Y-%m-%d"
-                ).date()
+                goal.deadline = storage.parse_date(args.deadline)
             except ValueError:
                 print(
                     f"Error: invalid deadline format '{args.deadline}'. Use YYYY-MM-DD"
                 )
                 return 1
 
-        # Always update time_worked from sessions.csv (after estimate timestamp)
-        estimate_timestamp = goal.get("estimate_timestamp")
-        if isinstance(estimate_timestamp, dt.datetime):
-            goal["time_worked_seconds"] = storage.get_time_worked_for_title(
-                title, after_timestamp=estimate_timestamp
-            )
-        else:
-            # If no timestamp, use all time worked (backward compatibility)
-            goal["time_worked_seconds"] = storage.get_time_worked_for_title(title)
-        goal["time_worked_formatted"] = storage.format_hms(goal["time_worked_seconds"])
+        # Always update time_worked from sessions.csv (after estimate timestamp;
+        # all time worked without one, for backward compatibility)
+        goal.time_worked_seconds = storage.get_time_worked_for_title(
+            title, after_timestamp=goal.estimate_timestamp
+        )
+        goal.time_worked_formatted = storage.format_hms(goal.time_worked_seconds)
 
         # Recalculate start_by
-        estimate_obj = goal.get("estimate_seconds")
-        deadline_obj = goal.get("deadline")
-        time_worked_obj = goal.get("time_worked_seconds", 0)
-
-        if (
-            isinstance(estimate_obj, int)
-            and estimate_obj > 0
-            and isinstance(deadline_obj, dt.date)
-            and isinstance(time_worked_obj, int)
-        ):
-            goal["start_by"] = _calculate_start_by(
-                estimate_obj,
-                deadline_obj,
-                time_worked_obj,
+        if goal.estimate_seconds > 0 and goal.deadline is not None:
+            goal.start_by = _calculate_start_by(
+                goal.estimate_seconds,
+                goal.deadline,
+                goal.time_worked_seconds,
             )
 
-    # Update time_worked for all goals (in case sessions changed)
-    goals = _update_time_worked(goals)
-
-    # Save goals
+    # Only this goal changed; the others were synced with sessions.csv by
+    # load_goals_csv and get refreshed for display when goals are listed
     storage.save_goals_csv(goals)
 
     # Display result using summary helper
-    _print_goal_details(title, goal)
+    sys.stdout.write("\n".join(_goal_details_lines(title, goal)) + "\n")
     return 0
 
 
@@ -1,8 +1,8 @@
 import argparse
+import sys
 
 from .. import config, storage
 from . import Command
-from .fokus import fokus_run
 from .set import DEFAULT_BAR_WIDTH
 
 
@@ -50,10 +50,11 @@ def _format_progress_bar(title: str, length: int, current_page: int) -> str:
     percentage = (current_page / length) * 100 if length > 0 else 0.0
     percentage = min(percentage, 100.0)
 
-    # Create progress bar (similar to fokus command)
-    bar_width = int(config.get_config("bar_width", DEFAULT_BAR_WIDTH))
-    filled = int((percentage / 100) * bar_width)
-    bar = "█" * filled + "░" * (bar_width - filled)
+    # Create progress bar (similar to fokus command), in integer math
+    bar_width = config.get_config_int("bar_width", DEFAULT_BAR_WIDTH)
+    pages_done = max(0, min(current_page, length)) if length > 0 else 0
+    filled = pages_done * bar_width // length if length > 0 else 0
+    bar = storage.format_bar(bar_width, filled)
 
     return f"{title}:\n:>{bar} {int(percentage)}% ({current_page}/{length} pages)"
 
@@ -62,35 +63,12 @@ def _show_progress(title: str) -> bool:
     """Show progress bar and ask user if they want to start reading.
     Returns True if user wants to start, False otherwise.
     """
-    reads = storage.load_read_csv()
-    book = None
-    for r in reads:
-        if r.get("title") == title:
-            book = r
-            break
-
+    book = storage.load_read_by_title(title)
     if not book:
         print(f"Error: Book '{title}' not found in read.csv")
         return False
 
-    length = book.get("length", 0)
-    current_page = book.get("current_page", 0)
-    time_per_page_seconds = book.get("time_per_page_seconds", 0)
-
-    # Ensure types are int
-    if not isinstance(length, int):
-        length = 0
-    if not isinstance(current_page, int):
-        current_page = 0
-    if not isinstance(time_per_page_seconds, int):
-        time_per_page_seconds = 0
-
-    print(_format_progress_bar(title, length, current_page))
-
-    # Show estimated remaining time if available
-    estimate_line = _format_estimated_time(length, current_page, time_per_page_seconds)
-    if estimate_line:
-        print(estimate_line)
+    sys.stdout.write("\n".join(_book_lines(book)) + "\n")
 
     # Ask user if they want to start
     while True:
@@ -103,6 +81,17 @@ def _show_progress(title: str) -> bool:
             print("Please enter 'y' or 'n'")
 
 
+def _book_lines(book: storage.Book) -> list[str]:
+    """Progress bar lines for a book, plus the time estimate if available."""
+    lines = [_format_progress_bar(book.title, book.length, book.current_page)]
+    estimate_line = _format_estimated_time(
+        book.length, book.current_page, book.time_per_page_seconds
+    )
+    if estimate_line:
+        lines.append(estimate_line)
+    return lines
+
+
 def _show_all_progress() -> None:
     """Show progress bars for all books in read.csv."""
     reads = storage.load_read_csv()
@@ -111,27 +100,11 @@ def _show_all_progress() -> None:
         print("No books in read.csv")
         return
 
+    out: list[str] = []
     for book in reads:
-        title_obj = book.get("title", "")
-        length_obj = book.get("length", 0)
-        current_page_obj = book.get("current_page", 0)
-        time_per_page_obj = book.get("time_per_page_seconds", 0)
-
-        # Ensure types
-        title = str(title_obj) if title_obj else ""
-        length = int(length_obj) if isinstance(length_obj, int) else 0
-        current_page = int(current_page_obj) if isinstance(current_page_obj, int) else 0
-        time_per_page_seconds = (
-            int(time_per_page_obj) if isinstance(time_per_page_obj, int) else 0
-        )
-
-        print(_format_progress_bar(title, length, current_page))
-        estimate_line = _format_estimated_time(
-            length, current_page, time_per_page_seconds
-        )
-        if estimate_line:
-            print(estimate_line)
-        print()  # Empty line between books
+        out.extend(_book_lines(book))
+        out.append("")  # Empty line between books
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def _format_estimated_time(
@@ -177,25 +150,19 @@ def read_run(args: argparse.Namespace) -> int:
             print(f"Error: length must be > 0, got {length}")
             return 1
 
-        # Load existing reads
-        reads = storage.load_read_csv()
-
         # Check if title already exists
-        for r in reads:
-            if r.get("title") == title:
-                print(f"Error: Book '{title}' already exists in read.csv")
-                return 1
+        if storage.load_read_by_title(title) is not None:
+            print(f"Error: Book '{title}' already exists in read.csv")
+            return 1
 
         # Add new entry
-        reads.append(
-            {
-                "title": title,
-                "length": length,
-                "current_page": 0,
-                "time_per_page_seconds": time_per_page_seconds,
-            }
+        storage.append_read_csv(
+            storage.Book(
+                title=title,
+                length=length,
+                time_per_page_seconds=time_per_page_seconds,
+            )
         )
-        storage.save_read_csv(reads)
         print(f"Added '{title}' with {length} pages to read.csv")
         return 0
 
@@ -214,33 +181,20 @@ def read_run(args: argparse.Namespace) -> int:
         # Load existing reads
         reads = storage.load_read_csv()
 
-        # Find the book
-        book_index = None
-        for i, r in enumerate(reads):
-            if r.get("title") == title:
-                book_index = i
-                break
-
-        if book_index is None:
+        # Find the book; it is updated in place and saved with the rest
+        book = next((r for r in reads if r.title == title), None)
+        if book is None:
             print(f"Error: Book '{title}' not found in read.csv")
             return 1
 
-        book = reads[book_index]
-        length = book.get("length", 0)
-
-        # Ensure length is int
-        if not isinstance(length, int):
-            length = 0
-
         if args.plus is not None:
             # Increment current_page
             if args.plus < 0:
                 print(f"Error: plus must be > 0, got {args.plus}")
                 return 1
-            current = book.get("current_page", 0)
-            new_page = current + args.plus
+            new_page = book.current_page + args.plus
 
-            book["current_page"] = new_page
+            book.current_page = new_page
             print(
                 f"Updated '{title}': current_page = {new_page} (incremented by {args.plus})"
             )
@@ -251,16 +205,15 @@ def read_run(args: argparse.Namespace) -> int:
                 return 1
             new_page = args.at
 
-            book["current_page"] = new_page
+            book.current_page = new_page
             print(f"Updated '{title}': current_page = {new_page}")
 
         if time_per_page_seconds is not None:
-            book["time_per_page_seconds"] = time_per_page_seconds
+            book.time_per_page_seconds = time_per_page_seconds
             print(
                 f"Updated '{title}': time_per_page_seconds = {time_per_page_seconds}s"
             )
 
-        reads[book_index] = book
         storage.save_read_csv(reads)
         return 0
 
@@ -270,7 +223,10 @@ def read_run(args: argparse.Namespace) -> int:
             # Show progress for specific book and ask if user wants to start
             start = _show_progress(args.title)
             if start:
-                # User wants to start reading - start a fokus session
+                # User wants to start reading - start a fokus session. fokus
+                # pulls in the terminal modules, so only import it here.
+                from .fokus import fokus_run
+
                 fokus_args = argparse.Namespace(title=args.title, goal=None)
                 return fokus_run(fokus_args)
             return 0
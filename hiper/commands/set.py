@@ -1,9 +1,8 @@
 import argparse
 import os
-from typing import List
+import sys
 
 from .. import config, storage
-from .. import messages as msgs
 from . import Command
 
 DEFAULT_BAR_WIDTH = "42"
@@ -57,21 +56,31 @@ def set_run(args: argparse.Namespace) -> int:
         countdown = config.get_config("countdown", DEFAULT_COUNTDOWN)
         work_per_day = config.get_config("work_per_day", DEFAULT_WORK_PER_DAY)
 
-        print("Current settings:")
-        print(f"  lang: {lang}")
-        print(f"  nick: {nick}")
-        print(f"  savedir: {savedir}")
-        print(f"  clock: {clock}")
-        print(f"  bar_width: {bar_width}")
-        print(f"  clock_length: {clock_length}")
-        print(f"  estimate_bar: {estimate_bar}")
-        print(f"  countdown: {countdown}")
-        print(f"  work_per_day: {work_per_day}")
+        sys.stdout.write(
+            "Current settings:\n"
+            f"  lang: {lang}\n"
+            f"  nick: {nick}\n"
+            f"  savedir: {savedir}\n"
+            f"  clock: {clock}\n"
+            f"  bar_width: {bar_width}\n"
+            f"  clock_length: {clock_length}\n"
+            f"  estimate_bar: {estimate_bar}\n"
+            f"  countdown: {countdown}\n"
+            f"  work_per_day: {work_per_day}\n"
+        )
         return 0
 
-    # Set values
-    updated: List[str] = []
+    # Apply every option in memory and write config.json once at the end.
+    with config.batch():
+        return _apply_settings(args)
+
+
+def _apply_settings(args: argparse.Namespace) -> int:
+    updated: list[str] = []
     if args.lang is not None:
+        # messages imports DEFAULT_LANG from this module, so load it lazily.
+        from .. import messages as msgs
+
         lang = args.lang.strip().lower()
         config.set_config("lang", lang)
         msgs.set_language(lang)
@@ -87,12 +96,13 @@ def set_run(args: argparse.Namespace) -> int:
         if not os.path.isabs(savedir):
             print(f"Error: savedir must be an absolute path: {savedir}")
             return 1
-        if not os.path.exists(savedir):
-            try:
-                os.makedirs(savedir, exist_ok=True)
-            except Exception as e:
-                print(f"Error: cannot create directory {savedir}: {e}")
-                return 1
+        # makedirs already tolerates an existing directory; no separate
+        # exists() check needed.
+        try:
+            os.makedirs(savedir, exist_ok=True)
+        except OSError as e:
+            print(f"Error: cannot create directory {savedir}: {e}")
+            return 1
         config.set_config("savedir", savedir)
         updated.append(f"savedir={savedir}")
 
@@ -144,7 +154,7 @@ def set_run(args: argparse.Namespace) -> int:
             seconds = storage.parse_duration(work_per_day)
             if seconds <= 0:
                 raise ValueError("must be greater than zero")
-        except Exception as e:
+        except ValueError as e:
             print(f"Error: invalid work-per-day '{work_per_day}': {e}")
             return 1
         # Store original string so display matches user intent.
@@ -1,43 +1,111 @@
+import contextlib
 import json
 import os
-from typing import Dict
+from collections.abc import Generator
 
 _DEFAULT_DATA_DIR = os.path.join(os.path.expanduser("~"), ".local", "share", "hiper")
 _CONFIG_FILE = os.path.join(_DEFAULT_DATA_DIR, "config.json")
-_CONFIG_CACHE: Dict[str, str] | None = None
+_CONFIG_CACHE: dict[str, str] | None = None
+# (key, default) -> parsed int, for get_config_int; cleared whenever the
+# config changes
+_INT_CACHE: dict[tuple[str, str], int] = {}
+# Set once the default data dir is known to exist.
+_DIR_READY = False
+# Nesting depth of batch(); while > 0, set_config only marks the config dirty.
+_BATCH_DEPTH = 0
+_DIRTY = False
 
 
-def _load_config() -> Dict[str, str]:
+def _load_config() -> dict[str, str]:
     global _CONFIG_CACHE
     if _CONFIG_CACHE is not None:
         return _CONFIG_CACHE
 
-    cache: Dict[str, str] = {}
+    cache: dict[str, str] = {}
     if os.path.exists(_CONFIG_FILE):
         try:
             with open(_CONFIG_FILE, "r", encoding="utf-8") as f:
                 cache = json.load(f)
-        except Exception as e:
+        except (OSError, ValueError) as e:
             print(f"Error: cannot load config file {_CONFIG_FILE}: {e}")
 
     _CONFIG_CACHE = cache  # type: ignore
     return cache
 
 
-def _save_config(cfg: Dict[str, str]) -> None:
-    global _CONFIG_CACHE
-    os.makedirs(_DEFAULT_DATA_DIR, exist_ok=True)
+def _write_config(cfg: dict[str, str]) -> None:
+    """Write config.json atomically: dump to a sibling file, then rename."""
+    global _DIR_READY
+    if not _DIR_READY:
+        os.makedirs(_DEFAULT_DATA_DIR, exist_ok=True)
+        _DIR_READY = True  # type: ignore
+
+    tmp_path = _CONFIG_FILE + ".tmp"
+    try:
+        # dumps + one write: json.dump would push each token through the
+        # text encoder separately.
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(cfg, indent=2))
+        os.replace(tmp_path, _CONFIG_FILE)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
 
-    with open(_CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2)
+
+def _save_config(cfg: dict[str, str]) -> None:
+    global _CONFIG_CACHE, _DIRTY
     _CONFIG_CACHE = cfg  # type: ignore
+    _INT_CACHE.clear()
+    if _BATCH_DEPTH:
+        _DIRTY = True  # type: ignore
+        return
+    _write_config(cfg)
+
+
+@contextlib.contextmanager
+def batch() -> Generator[None, None, None]:
+    """Defer config.json writes until the outermost batch exits.
+
+    set_config calls inside only update the in-memory config; the file is
+    written once on exit (also on an early return or error, so settings
+    applied before a failure are still kept, as with unbatched calls).
+    """
+    global _BATCH_DEPTH, _DIRTY
+    _BATCH_DEPTH += 1  # type: ignore
+    try:
+        yield
+    finally:
+        _BATCH_DEPTH -= 1  # type: ignore
+        if not _BATCH_DEPTH and _DIRTY and _CONFIG_CACHE is not None:
+            _DIRTY = False  # type: ignore
+            _write_config(_CONFIG_CACHE)
+
+
+def invalidate_cache() -> None:
+    """Forget the cached config so the next read goes back to config.json."""
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = None  # type: ignore
+    _INT_CACHE.clear()
 
 
 def get_config(key: str, default: str = "") -> str:
-    cfg = _load_config()
+    cfg = _CONFIG_CACHE if _CONFIG_CACHE is not None else _load_config()
     return cfg.get(key, default)
 
 
+def get_config_int(key: str, default: str) -> int:
+    """Return an integer setting, parsed once until the config changes.
+
+    Raises ValueError, like int(), when the stored value is not a number.
+    """
+    cache_key = (key, default)
+    value = _INT_CACHE.get(cache_key)
+    if value is None:
+        value = _INT_CACHE[cache_key] = int(get_config(key, default))
+    return value
+
+
 def set_config(key: str, value: str):
     cfg = _load_config()
     cfg[key] = value
@@ -1,20 +1,46 @@
 import datetime as dt
-from typing import Optional
 
 from . import config, storage
 from .commands.set import DEFAULT_LANG
 
+# language -> message key -> str.format template. Every language needs the
+# same keys as "en"; unknown languages fall back to "en".
+_TEMPLATES: dict[str, dict[str, str]] = {
+    "en": {
+        "instructions": "",
+        "saved_session": "Saved session: {duration}",
+        "cancelled": "Session cancelled; nothing saved.",
+        "interrupted": "Interrupted. Fokused for {elapsed}.\n"
+        "Use hiper postfokus --duration {elapsed} --title TITLE "
+        "if you want to save the session.",
+        "paused": "---------------------------------\n"
+        "Paused at {time}.\n"
+        "Fokused in total for {elapsed}.\n"
+        "---------------------------------",
+        "command_prompt": ":> ",
+        "saved_path": "Saved to: {path}",
+        "stats_header": "Statistics",
+        "stats_header_title": "Statistics {title}",
+        "resuming": "Paused for {pause}, resuming at {time}",
+        "invalid_X": "Invalid {X}: {msg}",
+        "language_set": "Language set to: {lang}",
+    },
+}
+
 
 def _load_lang_from_config() -> str:
     return config.get_config("lang", DEFAULT_LANG)
 
 
 _LANG: str = _load_lang_from_config()
+# Templates for _LANG, resolved once here and again on set_language.
+_ACTIVE: dict[str, str] = _TEMPLATES.get(_LANG, _TEMPLATES["en"])
 
 
 def set_language(lang: str) -> None:
-    global _LANG
+    global _LANG, _ACTIVE
     _LANG = lang or DEFAULT_LANG  # type: ignore
+    _ACTIVE = _TEMPLATES.get(_LANG, _TEMPLATES["en"])  # type: ignore
 
 
 def save_language(lang: str) -> None:
@@ -23,71 +49,50 @@ def save_language(lang: str) -> None:
     set_language(lang)
 
 
+def _clock_time(t: dt.datetime) -> str:
+    """HH:MM:SS, as strftime("%H:%M:%S") without the C strftime round trip."""
+    return f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+
+
 def instructions_line() -> str:
-    texts = {
-        "en": "",
-    }
-    return texts.get(_LANG, texts["en"])
+    return _ACTIVE["instructions"]
 
 
 def started_at_line(start_time: dt.datetime) -> str:
-    return f"Started at {start_time.strftime('%H:%M:%S')}"
+    return f"Started at {_clock_time(start_time)}"
 
 
 def saved_session_line(formatted_duration: str) -> str:
-    templates = {
-        "en": f"Saved session: {formatted_duration}",
-    }
-    return templates.get(_LANG, templates["en"])
+    return _ACTIVE["saved_session"].format(duration=formatted_duration)
 
 
 def cancelled_line() -> str:
-    texts = {
-        "en": "Session cancelled; nothing saved.",
-    }
-    return texts.get(_LANG, texts["en"])
+    return _ACTIVE["cancelled"]
 
 
 def interrupted_line(elapsed_seconds: int) -> str:
-    elapsed = storage.format_hms(elapsed_seconds)
-    templates = {
-        "en": f"Interrupted. Fokused for {elapsed}.\n"
-        f"Use hiper postfokus --duration {elapsed} --title TITLE "
-        "if you want to save the session.",
-    }
-    return templates.get(_LANG, templates["en"])
+    return _ACTIVE["interrupted"].format(elapsed=storage.format_hms(elapsed_seconds))
 
 
 def paused_line(current_time: dt.datetime, elapsed_seconds: int) -> str:
-    templates = {
-        "en": "---------------------------------\n"
-        f"Paused at {current_time.strftime('%H:%M:%S')}.\n"
-        f"Fokused in total for {storage.format_hms(elapsed_seconds)}.\n"
-        "---------------------------------",
-    }
-    return templates.get(_LANG, templates["en"])
+    return _ACTIVE["paused"].format(
+        time=_clock_time(current_time),
+        elapsed=storage.format_hms(elapsed_seconds),
+    )
 
 
 def command_prompt() -> str:
-    prompts = {
-        "en": ":> ",
-    }
-    return prompts.get(_LANG, prompts["en"])
+    return _ACTIVE["command_prompt"]
 
 
 def saved_path_line(path: str) -> str:
-    templates = {
-        "en": f"Saved to: {path}",
-    }
-    return templates.get(_LANG, templates["en"])
+    return _ACTIVE["saved_path"].format(path=path)
 
 
-def stats_header(title_filter: Optional[str] = None) -> str:
+def stats_header(title_filter: str | None = None) -> str:
     if title_filter:
-        templates = {"en": f"Statistics {title_filter}"}
-        return templates.get(_LANG, templates["en"])
-    templates = {"en": "Statistics"}
-    return templates.get(_LANG, templates["en"])
+        return _ACTIVE["stats_header_title"].format(title=title_filter)
+    return _ACTIVE["stats_header"]
 
 
 def stats_line(key: str, value: str) -> str:
@@ -95,27 +100,20 @@ def stats_line(key: str, value: str) -> str:
 
 
 def resuming_line(pause_duration_formatted: str, resume_time: dt.datetime) -> str:
-    templates = {
-        "en": f"Paused for {pause_duration_formatted}, "
-        f"resuming at {resume_time.strftime('%H:%M:%S')}",
-    }
-    return templates.get(_LANG, templates["en"])
+    return _ACTIVE["resuming"].format(
+        pause=pause_duration_formatted, time=_clock_time(resume_time)
+    )
 
 
 def invalid_X(msg: str, X: str) -> str:
-    templates = {
-        "en": f"Invalid {X}: {msg}",
-    }
-    return templates.get(_LANG, templates["en"]).format(msg=msg)
+    return _ACTIVE["invalid_X"].format(X=X, msg=msg)
 
 
 def language_set(lang: str) -> str:
-    templates = {
-        "en": f"Language set to: {lang}",
-    }
-    return templates.get(_LANG, templates["en"]).format(lang=lang)
+    return _ACTIVE["language_set"].format(lang=lang)
 
 
 # To add translations:
-# - Create entries for your language code (e.g., "tr") alongside "en" in the
-#   dictionaries above (templates/texts/prompts).
+# - Add a dictionary for your language code (e.g., "tr") to _TEMPLATES with
+#   the same keys as "en"; placeholders like {elapsed} are filled in by the
+#   functions above.
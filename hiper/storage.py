@@ -1,27 +1,56 @@
+import bisect
+import contextlib
 import csv
 import datetime as dt
+import functools
+import io
 import os
-from typing import Dict, List, Optional
+import re
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import BinaryIO
 
 from . import config
 
+_GOALS_HEADER = [
+    "title",
+    "estimate_seconds",
+    "estimate_formatted",
+    "estimate_timestamp",
+    "deadline",
+    "time_worked_seconds",
+    "time_worked_formatted",
+    "start_by",
+]
 
-def get_data_dir() -> str:
-    data_dir = config.get_data_dir()
-    os.makedirs(data_dir, exist_ok=True)
-    return data_dir
 
+def _file_size(path: str) -> int:
+    """Return the size of the file at path, or -1 if it cannot be stat'ed.
 
-DATA_DIR = get_data_dir()
+    One os.stat, where os.path.exists + os.path.getsize would take two.
+    """
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return -1
 
-SESSIONS_CSV = os.path.join(DATA_DIR, "sessions.csv")
-GOALS_CSV = os.path.join(DATA_DIR, "goals.csv")
-READ_CSV = os.path.join(DATA_DIR, "read.csv")
-LOG_CSV = os.path.join(DATA_DIR, "log.csv")
+
+# The data dir most recently created by get_data_dir, so repeated calls
+# within one process skip the makedirs.
+_READY_DATA_DIR: str | None = None
+
+
+def get_data_dir() -> str:
+    global _READY_DATA_DIR
+    data_dir = config.get_data_dir()
+    if data_dir != _READY_DATA_DIR:
+        os.makedirs(data_dir, exist_ok=True)
+        _READY_DATA_DIR = data_dir  # type: ignore
+    return data_dir
 
 
 def _ensure_csv_header(path: str) -> None:
-    if not os.path.exists(path) or os.path.getsize(path) == 0:
+    if _file_size(path) <= 0:
         with open(path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(
@@ -50,8 +79,8 @@ def save_session_csv(
     # Update goals.csv to ensure this title has an entry and time_worked is updated
     # This ensures goals.csv stays in sync with sessions.csv
     try:
-        load_goals_csv()
-    except Exception as e:
+        _add_session_to_goals(title or "", start, duration_seconds)
+    except Exception as e:  # noqa: BLE001
         # If updating goals fails, don't fail the session save
         print(f"Error updating goals.csv: {e}")
 
@@ -66,208 +95,243 @@ def format_hms(seconds: int) -> str:
     return f"{minutes:02d}m{secs:02d}s"
 
 
+@functools.cache
+def _bar_cells(width: int) -> str:
+    """width filled cells followed by width empty ones.
+
+    Any bar of that width is a single slice of this string.
+    """
+    return "█" * width + "░" * width
+
+
+def format_bar(width: int, filled: int) -> str:
+    """Return a progress bar of width cells, the first filled of them full."""
+    return _bar_cells(width)[width - filled : 2 * width - filled]
+
+
+def parse_date(s: str) -> dt.date:
+    """Parse YYYY-MM-DD, accepting exactly what strptime("%Y-%m-%d") does."""
+    # fromisoformat is much cheaper than strptime but also takes other ISO
+    # forms (20260105, 2026-W01-1), so only use it for the canonical shape.
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        return dt.date.fromisoformat(s)
+    return dt.datetime.strptime(s, "%Y-%m-%d").date()
+
+
+# One duration component: a number with an optional unit (no unit = minutes)
+_DURATION_RE = re.compile(r"(\d+)([hms]?)")
+# A whole duration: unit-terminated components, then at most one bare number.
+# Each string matches only one way, so invalid input cannot backtrack
+# exponentially; the empty string is rejected before this is tried.
+_DURATION_FULL_RE = re.compile(r"(?:\d+[hms])*\d*")
+_UNIT_SECONDS = {"h": 3600, "m": 60, "s": 1, "": 60}
+
+
+def _duration_error(s: str) -> ValueError:
+    """Describe the first character of s that is not part of a component."""
+    pos = 0
+    while True:
+        match = _DURATION_RE.match(s, pos)
+        if match is None:
+            break
+        pos = match.end()
+    ch = s[pos]
+    if ch in ("h", "m", "s"):
+        return ValueError("missing number before unit")
+    return ValueError(f"unexpected character '{ch}' in duration")
+
+
 def parse_duration(s: str) -> int:
     s = s.strip().lower()
     if not s:
         raise ValueError("empty duration")
-    total = 0
-    num = ""
-    i = 0
-    while i < len(s):
-        ch = s[i]
-        if ch.isdigit():
-            num += ch
-            i += 1
-            continue
-        if ch in ("h", "m", "s"):
-            if not num:
-                raise ValueError("missing number before unit")
-            val = int(num)
-            if ch == "h":
-                total += val * 3600
-            elif ch == "m":
-                total += val * 60
-            else:
-                total += val
-            num = ""
-            i += 1
-            continue
-        raise ValueError(f"unexpected character '{ch}' in duration")
-    if num:
-        # trailing number with no unit -> minutes
-        total += int(num) * 60
+    if _DURATION_FULL_RE.fullmatch(s) is None:
+        raise _duration_error(s)
+    total = sum(int(num) * _UNIT_SECONDS[unit] for num, unit in _DURATION_RE.findall(s))
     if total <= 0:
         raise ValueError("duration must be > 0")
     return total
 
 
-def load_sessions_csv() -> List[Dict[str, object]]:
+@dataclass(slots=True)
+class Session:
+    """A sessions.csv row with its values parsed."""
+
+    title: str
+    start: dt.datetime
+    end: dt.datetime
+    duration: int
+
+
+def iter_sessions_csv() -> Iterator[Session]:
+    """Yield sessions one at a time; see load_sessions_csv."""
     data_dir = get_data_dir()
     sessions_csv = os.path.join(data_dir, "sessions.csv")
-    if not os.path.exists(sessions_csv) or os.path.getsize(sessions_csv) == 0:
-        return []
-    rows: List[Dict[str, object]] = []
+    if _file_size(sessions_csv) <= 0:
+        return
     with open(sessions_csv, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        # Plain csv.reader with column positions taken from the header once;
+        # DictReader would build a throwaway dict for every line.
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = {name: i for i, name in enumerate(header)}
+        start_i = columns.get("start")
+        end_i = columns.get("end")
+        if start_i is None or end_i is None:
+            return
+        title_i = columns.get("title", -1)
+        duration_i = columns.get("duration", -1)
+        # Bound once; looked up twice per row otherwise
+        fromisoformat = dt.datetime.fromisoformat
         for row in reader:
-            title = row.get("title", "")
-            start = (
-                dt.datetime.fromisoformat(row["start"]) if row.get("start") else None
-            )
-            end = dt.datetime.fromisoformat(row["end"]) if row.get("end") else None
-            duration = int(row.get("duration", "0") or 0)
-            if start is None or end is None:
+            n = len(row)
+            start_str = row[start_i] if start_i < n else ""
+            end_str = row[end_i] if end_i < n else ""
+            if not start_str or not end_str:
                 continue
-            rows.append(
-                {
-                    "title": title or "",
-                    "start": start,
-                    "end": end,
-                    "duration": duration,
-                }
-            )
-    return rows
+            title = row[title_i] if 0 <= title_i < n else ""
+            duration_str = row[duration_i] if 0 <= duration_i < n else ""
+            try:
+                start = fromisoformat(start_str)
+                end = fromisoformat(end_str)
+                duration = int(duration_str or 0)
+            except ValueError:
+                continue
+            yield Session(title, start, end, duration)
+
+
+def load_sessions_csv() -> list[Session]:
+    """Load every session in sessions.csv.
+
+    Rows that lack a start or end, or that fail to parse, are skipped.
+    """
+    return list(iter_sessions_csv())
 
 
 def _ensure_goals_csv_header(path: str) -> None:
-    if not os.path.exists(path) or os.path.getsize(path) == 0:
+    if _file_size(path) <= 0:
         with open(path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
-            writer.writerow(
-                [
-                    "title",
-                    "estimate_seconds",
-                    "estimate_formatted",
-                    "estimate_timestamp",
-                    "deadline",
-                    "time_worked_seconds",
-                    "time_worked_formatted",
-                    "start_by",
-                ]
-            )
+            writer.writerow(_GOALS_HEADER)
+
+
+@dataclass(slots=True)
+class Goal:
+    """A goals.csv row with its values parsed."""
+
+    title: str
+    estimate_seconds: int = 0
+    estimate_formatted: str = ""
+    estimate_timestamp: dt.datetime | None = None
+    deadline: dt.date | None = None
+    time_worked_seconds: int = 0
+    time_worked_formatted: str = ""
+    start_by: dt.date | None = None
+
+
+def _parse_goal_row(row: dict[str, str]) -> Goal | None:
+    """Convert a goals.csv row into a Goal; None for rows without a title."""
+    title = row.get("title", "").strip()
+    if not title:
+        return None
+
+    estimate_str = row.get("estimate_seconds", "").strip()
+    estimate_seconds = int(estimate_str) if estimate_str else 0
+
+    deadline_str = row.get("deadline", "").strip()
+    deadline = parse_date(deadline_str) if deadline_str else None
+
+    estimate_timestamp_str = row.get("estimate_timestamp", "").strip()
+    estimate_timestamp = (
+        dt.datetime.fromisoformat(estimate_timestamp_str)
+        if estimate_timestamp_str
+        else None
+    )
+
+    time_worked_str = row.get("time_worked_seconds", "").strip()
+    time_worked_seconds = int(time_worked_str) if time_worked_str else 0
+
+    start_by_str = row.get("start_by", "").strip()
+    start_by = parse_date(start_by_str) if start_by_str else None
+
+    # Compute formatted values if not present (for backward compatibility)
+    estimate_formatted = row.get("estimate_formatted", "").strip()
+    if not estimate_formatted and estimate_seconds > 0:
+        estimate_formatted = format_hms(estimate_seconds)
+
+    time_worked_formatted = row.get("time_worked_formatted", "").strip()
+    if not time_worked_formatted and time_worked_seconds > 0:
+        time_worked_formatted = format_hms(time_worked_seconds)
+
+    return Goal(
+        title=title,
+        estimate_seconds=estimate_seconds,
+        estimate_formatted=estimate_formatted,
+        estimate_timestamp=estimate_timestamp,
+        deadline=deadline,
+        time_worked_seconds=time_worked_seconds,
+        time_worked_formatted=time_worked_formatted,
+        start_by=start_by,
+    )
+
+
+def _read_goals_file(goals_csv: str) -> dict[str, Goal]:
+    """Parse goals.csv as is, keyed by title in file order."""
+    goals: dict[str, Goal] = {}
+    if _file_size(goals_csv) > 0:
+        with open(goals_csv, "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                goal = _parse_goal_row(row)
+                if goal is not None:
+                    goals[goal.title] = goal
+    return goals
 
 
-def load_goals_csv() -> List[Dict[str, object]]:
+def load_goals_csv() -> list[Goal]:
     """Load goals from goals.csv, ensuring all session titles have entries."""
     data_dir = get_data_dir()
     goals_csv = os.path.join(data_dir, "goals.csv")
     _ensure_goals_csv_header(goals_csv)
 
     # Load existing goals
-    existing_goals: Dict[str, Dict[str, object]] = {}
-    if os.path.exists(goals_csv) and os.path.getsize(goals_csv) > 0:
-        with open(goals_csv, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                title = row.get("title", "").strip()
-                if not title:
-                    continue
-
-                estimate_str = row.get("estimate_seconds", "").strip()
-                estimate_seconds = int(estimate_str) if estimate_str else 0
-
-                deadline_str = row.get("deadline", "").strip()
-                deadline = (
-                    dt.datetime.strptime(deadline_str, "%Y-%m-%d").date()
-                    if deadline_str
-                    else None
-                )
-
-                estimate_timestamp_str = row.get("estimate_timestamp", "").strip()
-                estimate_timestamp = (
-                    dt.datetime.fromisoformat(estimate_timestamp_str)
-                    if estimate_timestamp_str
-                    else None
-                )
-
-                time_worked_str = row.get("time_worked_seconds", "").strip()
-                time_worked_seconds = int(time_worked_str) if time_worked_str else 0
-
-                start_by_str = row.get("start_by", "").strip()
-                start_by = (
-                    dt.datetime.strptime(start_by_str, "%Y-%m-%d").date()
-                    if start_by_str
-                    else None
-                )
-
-                # Compute formatted values if not present (for backward compatibility)
-                estimate_formatted = row.get("estimate_formatted", "").strip()
-                if not estimate_formatted and estimate_seconds > 0:
-                    estimate_formatted = format_hms(estimate_seconds)
-
-                time_worked_formatted = row.get("time_worked_formatted", "").strip()
-                if not time_worked_formatted and time_worked_seconds > 0:
-                    time_worked_formatted = format_hms(time_worked_seconds)
-
-                existing_goals[title] = {
-                    "title": title,
-                    "estimate_seconds": estimate_seconds,
-                    "estimate_formatted": estimate_formatted,
-                    "estimate_timestamp": estimate_timestamp,
-                    "deadline": deadline,
-                    "time_worked_seconds": time_worked_seconds,
-                    "time_worked_formatted": time_worked_formatted,
-                    "start_by": start_by,
-                }
-
-    # Get all unique titles from sessions.csv
-    sessions = load_sessions_csv()
-    session_titles: set[str] = set()
-    for session in sessions:
-        title_obj = session.get("title")
-        if isinstance(title_obj, str):
-            title = title_obj.strip()
-            if title:
-                session_titles.add(title)
+    existing_goals = _read_goals_file(goals_csv)
+
+    # One pass over sessions.csv gives every session title along with its time
+    # worked (after the estimate timestamp, where the goal has one)
+    cutoffs: dict[str, dt.datetime] = {}
+    for title, goal in existing_goals.items():
+        if goal.estimate_timestamp is not None:
+            cutoffs[title] = goal.estimate_timestamp
+    worked = get_time_worked_by_title(cutoffs)
 
     # Ensure all session titles have goal entries
     new_entries_created = False
-    for title in session_titles:
-        if title not in existing_goals:
+    for title in worked:
+        if title and title not in existing_goals:
             # Create entry with blank estimate/deadline/start_by
-            existing_goals[title] = {
-                "title": title,
-                "estimate_seconds": 0,
-                "estimate_formatted": "",
-                "estimate_timestamp": None,
-                "deadline": None,
-                "time_worked_seconds": 0,
-                "time_worked_formatted": "",
-                "start_by": None,
-            }
+            existing_goals[title] = Goal(title=title)
             new_entries_created = True
 
     # Update time_worked for all goals
     time_updated = False
     for goal in existing_goals.values():
-        goal_title = goal.get("title")
-        if isinstance(goal_title, str):
-            # Get time worked after estimate timestamp if it exists
-            estimate_timestamp = goal.get("estimate_timestamp")
-            if isinstance(estimate_timestamp, dt.datetime):
-                new_time = get_time_worked_for_title(
-                    goal_title, after_timestamp=estimate_timestamp
-                )
-            else:
-                # If no timestamp, use all time worked (backward compatibility)
-                new_time = get_time_worked_for_title(goal_title)
-            if goal.get("time_worked_seconds", 0) != new_time:
-                goal["time_worked_seconds"] = new_time
-                goal["time_worked_formatted"] = (
-                    format_hms(new_time) if new_time > 0 else ""
-                )
-                time_updated = True
-            elif not goal.get("time_worked_formatted"):
-                # Ensure formatted value exists
-                goal["time_worked_formatted"] = (
-                    format_hms(new_time) if new_time > 0 else ""
-                )
+        # Time worked after the estimate timestamp if there is one, all time
+        # worked otherwise (backward compatibility)
+        new_time = worked.get(goal.title, (0, 0))[1]
+        if goal.time_worked_seconds != new_time:
+            goal.time_worked_seconds = new_time
+            goal.time_worked_formatted = format_hms(new_time) if new_time > 0 else ""
+            time_updated = True
+        elif not goal.time_worked_formatted:
+            # Ensure formatted value exists
+            goal.time_worked_formatted = format_hms(new_time) if new_time > 0 else ""
 
         # Ensure estimate_formatted exists
-        estimate_sec = goal.get("estimate_seconds", 0)
-        if isinstance(estimate_sec, int) and estimate_sec > 0:
-            if not goal.get("estimate_formatted"):
-                goal["estimate_formatted"] = format_hms(estimate_sec)
+        if goal.estimate_seconds > 0 and not goal.estimate_formatted:
+            goal.estimate_formatted = format_hms(goal.estimate_seconds)
 
     # Save if new entries were created or time_worked was updated
     if new_entries_created or time_updated:
@@ -276,103 +340,243 @@ def load_goals_csv() -> List[Dict[str, object]]:
     return list(existing_goals.values())
 
 
-def save_goals_csv(goals: List[Dict[str, object]]) -> str:
-    """Save goals to goals.csv."""
+def _add_session_to_goals(
+    title: str, start: dt.datetime, duration_seconds: int
+) -> None:
+    """Account one newly saved session in goals.csv.
+
+    Equivalent to the resync load_goals_csv does, assuming goals.csv was in
+    sync before the session was appended, but without rescanning
+    sessions.csv: the session's goal gets the duration added (if the session
+    starts at or after its estimate timestamp), or is created for a new title.
+    """
+    title = title.strip()
+    if not title:
+        return
+    goals_csv = os.path.join(get_data_dir(), "goals.csv")
+    _ensure_goals_csv_header(goals_csv)
+    goals = _read_goals_file(goals_csv)
+
+    goal = goals.get(title)
+    if goal is None:
+        goals[title] = Goal(
+            title=title,
+            time_worked_seconds=duration_seconds,
+            time_worked_formatted=(
+                format_hms(duration_seconds) if duration_seconds > 0 else ""
+            ),
+        )
+    elif duration_seconds and (
+        goal.estimate_timestamp is None or start >= goal.estimate_timestamp
+    ):
+        goal.time_worked_seconds += duration_seconds
+        goal.time_worked_formatted = format_hms(goal.time_worked_seconds)
+    else:
+        return
+    save_goals_csv(list(goals.values()))
+
+
+def load_goal_by_title(title: str) -> Goal | None:
+    """Return the goal with the given title from goals.csv, or None.
+
+    Stops reading at the first match. Unlike load_goals_csv this does not sync
+    goals.csv with sessions.csv, so time_worked_seconds may be stale.
+    """
+    goals_csv = os.path.join(get_data_dir(), "goals.csv")
+    if not os.path.exists(goals_csv):
+        return None
+    title = title.strip()
+    with open(goals_csv, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if (row.get("title") or "").strip() == title:
+                return _parse_goal_row(row)
+    return None
+
+
+def _goal_row(goal: Goal) -> list[str]:
+    """Convert a Goal into a goals.csv row, filling in missing formatted times."""
+    estimate_seconds = goal.estimate_seconds
+    estimate_formatted = goal.estimate_formatted
+    if not estimate_formatted and estimate_seconds > 0:
+        estimate_formatted = format_hms(estimate_seconds)
+
+    time_worked_seconds = goal.time_worked_seconds
+    time_worked_formatted = goal.time_worked_formatted
+    if not time_worked_formatted and time_worked_seconds > 0:
+        time_worked_formatted = format_hms(time_worked_seconds)
+
+    estimate_timestamp = goal.estimate_timestamp
+    deadline = goal.deadline
+    start_by = goal.start_by
+    return [
+        goal.title,
+        str(estimate_seconds) if estimate_seconds else "",
+        estimate_formatted,
+        estimate_timestamp.isoformat() if estimate_timestamp else "",
+        deadline.isoformat() if deadline else "",
+        str(time_worked_seconds) if time_worked_seconds else "",
+        time_worked_formatted,
+        start_by.isoformat() if start_by else "",
+    ]
+
+
+def save_goals_csv(goals: list[Goal]) -> str:
+    """Save goals to goals.csv.
+
+    The file is only rewritten when its content changes, and then atomically
+    through goals.csv.tmp.
+    """
+    data_dir = get_data_dir()
+    goals_csv = os.path.join(data_dir, "goals.csv")
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(_GOALS_HEADER)
+    writer.writerows(_goal_row(goal) for goal in goals)
+
+    data = buf.getvalue()
+    try:
+        with open(goals_csv, "r", newline="", encoding="utf-8") as f:
+            if f.read() == data:
+                return goals_csv
+    except (OSError, ValueError):
+        # Missing or undecodable; either way it gets rewritten
+        pass
+    tmp_path = goals_csv + ".tmp"
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp_path, goals_csv)
+    return goals_csv
+
+
+def stream_update_goals_csv(
+    predicate: Callable[[dict[str, str]], bool],
+    transform: Callable[[dict[str, str]], dict[str, str]],
+) -> int:
+    """Rewrite goals.csv row by row, transforming the rows matching predicate.
+
+    Rows are streamed into goals.csv.tmp, which then atomically replaces
+    goals.csv. The file is left untouched when no row matches.
+    Returns the number of transformed rows.
+    """
     data_dir = get_data_dir()
     goals_csv = os.path.join(data_dir, "goals.csv")
     _ensure_goals_csv_header(goals_csv)
-    with open(goals_csv, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "title",
-                "estimate_seconds",
-                "estimate_formatted",
-                "estimate_timestamp",
-                "deadline",
-                "time_worked_seconds",
-                "time_worked_formatted",
-                "start_by",
-            ]
-        )
-        for goal in goals:
-            estimate_seconds = goal.get("estimate_seconds", 0)
-            estimate_formatted = goal.get("estimate_formatted", "")
-            if (
-                not estimate_formatted
-                and isinstance(estimate_seconds, int)
-                and estimate_seconds > 0
-            ):
-                estimate_formatted = format_hms(estimate_seconds)
-
-            estimate_timestamp = goal.get("estimate_timestamp")
-
-            deadline = goal.get("deadline")
-            time_worked_seconds = goal.get("time_worked_seconds", 0)
-            time_worked_formatted = goal.get("time_worked_formatted", "")
-            if (
-                not time_worked_formatted
-                and isinstance(time_worked_seconds, int)
-                and time_worked_seconds > 0
-            ):
-                time_worked_formatted = format_hms(time_worked_seconds)
-
-            start_by = goal.get("start_by")
+    tmp_path = goals_csv + ".tmp"
 
-            writer.writerow(
-                [
-                    goal["title"],
-                    str(estimate_seconds) if estimate_seconds else "",
-                    estimate_formatted,
-                    estimate_timestamp.isoformat()
-                    if isinstance(estimate_timestamp, dt.datetime)
-                    else "",
-                    deadline.strftime("%Y-%m-%d")
-                    if isinstance(deadline, dt.date)
-                    else "",
-                    str(time_worked_seconds) if time_worked_seconds else "",
-                    time_worked_formatted,
-                    start_by.strftime("%Y-%m-%d")
-                    if isinstance(start_by, dt.date)
-                    else "",
-                ]
+    updated = 0
+    try:
+        with (
+            open(goals_csv, "r", newline="", encoding="utf-8") as src,
+            open(tmp_path, "w", newline="", encoding="utf-8") as dst,
+        ):
+            reader = csv.DictReader(src)
+            # Fields past the header land under a None key; drop them
+            writer = csv.DictWriter(
+                dst,
+                fieldnames=reader.fieldnames or _GOALS_HEADER,
+                extrasaction="ignore",
             )
-    return goals_csv
+            writer.writeheader()
+            for row in reader:
+                if predicate(row):
+                    row = transform(row)
+                    updated += 1
+                writer.writerow(row)
+
+        if updated:
+            os.replace(tmp_path, goals_csv)
+        else:
+            os.remove(tmp_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return updated
+
+
+# Per title (stripped): session starts in ascending order, and running totals
+# of their durations with a leading 0, so cumulative[i] is the time worked in
+# the first i sessions. Keyed on sessions.csv's (mtime_ns, size).
+_SessionsIndex = dict[str, tuple[list[dt.datetime], list[int]]]
+_SESSIONS_INDEX: tuple[tuple[int, int], _SessionsIndex] | None = None
+
+
+def _sessions_by_title() -> _SessionsIndex:
+    """Return the title index of sessions.csv, reading the file only once.
+
+    The index is kept for the rest of the process and rebuilt only when
+    sessions.csv changes (appending a session changes its size).
+    """
+    global _SESSIONS_INDEX
+    sessions_csv = os.path.join(get_data_dir(), "sessions.csv")
+    try:
+        st = os.stat(sessions_csv)
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = (0, 0)
+    if _SESSIONS_INDEX is not None and _SESSIONS_INDEX[0] == key:
+        return _SESSIONS_INDEX[1]
+
+    by_title: dict[str, list[tuple[dt.datetime, int]]] = {}
+    for session in iter_sessions_csv():
+        by_title.setdefault(session.title.strip(), []).append(
+            (session.start, session.duration)
+        )
+
+    index: _SessionsIndex = {}
+    for title, sessions in by_title.items():
+        # Stable, so sessions with equal starts keep their file order
+        sessions.sort(key=lambda s: s[0])
+        starts: list[dt.datetime] = []
+        cumulative = [0]
+        for start, duration in sessions:
+            starts.append(start)
+            cumulative.append(cumulative[-1] + duration)
+        index[title] = (starts, cumulative)
+    _SESSIONS_INDEX = (key, index)  # type: ignore
+    return index
+
+
+def _worked_after(
+    starts: list[dt.datetime], cumulative: list[int], after: dt.datetime | None
+) -> int:
+    """Time worked in sessions starting at or after `after` (all if None)."""
+    if after is None:
+        return cumulative[-1]
+    return cumulative[-1] - cumulative[bisect.bisect_left(starts, after)]
+
+
+def get_time_worked_by_title(
+    cutoffs: dict[str, dt.datetime] | None = None,
+) -> dict[str, tuple[int, int]]:
+    """Get time worked for every title in sessions.csv.
+
+    Returns {title: (total, after_cutoff)} keyed by stripped title, in order of
+    first appearance. after_cutoff only counts sessions that started at or
+    after cutoffs[title], as get_time_worked_for_title does with
+    after_timestamp; titles without a cutoff get their total twice.
+    """
+    cutoffs = cutoffs or {}
+    return {
+        title: (cumulative[-1], _worked_after(starts, cumulative, cutoffs.get(title)))
+        for title, (starts, cumulative) in _sessions_by_title().items()
+    }
 
 
 def get_time_worked_for_title(
-    title: str, after_timestamp: Optional[dt.datetime] = None
+    title: str, after_timestamp: dt.datetime | None = None
 ) -> int:
     """Get total time worked for a given title from sessions.csv.
     If after_timestamp is provided, only counts sessions that started after that timestamp.
     """
-    rows = load_sessions_csv()
-    total = 0
-    title_stripped = title.strip()
-    for row in rows:
-        row_title = row.get("title")
-        if isinstance(row_title, str) and row_title.strip() == title_stripped:
-            # Check if session started after timestamp
-            if after_timestamp:
-                start = row.get("start")
-                if not isinstance(start, dt.datetime):
-                    continue
-                if start < after_timestamp:
-                    continue
-
-            duration = row.get("duration", 0)
-            if isinstance(duration, int):
-                total += duration
-            elif isinstance(duration, str):
-                try:
-                    total += int(duration)
-                except (ValueError, TypeError):
-                    pass
-    return total
+    entry = _sessions_by_title().get(title.strip())
+    if entry is None:
+        return 0
+    return _worked_after(entry[0], entry[1], after_timestamp)
 
 
 def _ensure_read_csv_header(path: str) -> None:
-    if not os.path.exists(path) or os.path.getsize(path) == 0:
+    if _file_size(path) <= 0:
         with open(path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(
@@ -380,45 +584,79 @@ def _ensure_read_csv_header(path: str) -> None:
             )
 
 
-def load_read_csv() -> List[Dict[str, object]]:
+@dataclass(slots=True)
+class Book:
+    """A read.csv row with its values parsed."""
+
+    title: str
+    length: int = 0
+    current_page: int = 0
+    time_per_page_seconds: int = 0
+
+
+def _parse_read_row(row: dict[str, str]) -> Book | None:
+    """Convert a read.csv row into a Book; None for rows without a title."""
+    title = row.get("title", "").strip()
+    if not title:
+        return None
+
+    length_str = row.get("length", "").strip()
+    current_page_str = row.get("current_page", "").strip()
+    time_per_page_str = row.get("time_per_page_seconds", "").strip()
+    return Book(
+        title=title,
+        length=int(length_str) if length_str else 0,
+        current_page=int(current_page_str) if current_page_str else 0,
+        time_per_page_seconds=int(time_per_page_str) if time_per_page_str else 0,
+    )
+
+
+def load_read_csv() -> list[Book]:
     """Load reading list from read.csv."""
     data_dir = get_data_dir()
     read_csv = os.path.join(data_dir, "read.csv")
     _ensure_read_csv_header(read_csv)
 
-    rows: List[Dict[str, object]] = []
-    if not os.path.exists(read_csv) or os.path.getsize(read_csv) == 0:
+    rows: list[Book] = []
+    if _file_size(read_csv) <= 0:
         return rows
 
     with open(read_csv, "r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
-            title = row.get("title", "").strip()
-            if not title:
-                continue
+            book = _parse_read_row(row)
+            if book is not None:
+                rows.append(book)
 
-            length_str = row.get("length", "").strip()
-            length = int(length_str) if length_str else 0
+    return rows
 
-            current_page_str = row.get("current_page", "").strip()
-            current_page = int(current_page_str) if current_page_str else 0
 
-            time_per_page_str = row.get("time_per_page_seconds", "").strip()
-            time_per_page_seconds = int(time_per_page_str) if time_per_page_str else 0
+def load_read_by_title(title: str) -> Book | None:
+    """Return the book with the given title from read.csv, or None.
 
-            rows.append(
-                {
-                    "title": title,
-                    "length": length,
-                    "current_page": current_page,
-                    "time_per_page_seconds": time_per_page_seconds,
-                }
-            )
+    Stops reading at the first match.
+    """
+    read_csv = os.path.join(get_data_dir(), "read.csv")
+    if not os.path.exists(read_csv):
+        return None
+    with open(read_csv, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if (row.get("title") or "").strip() == title:
+                return _parse_read_row(row)
+    return None
 
-    return rows
+
+def _read_row(book: Book) -> list[str]:
+    """Convert a Book into a read.csv row."""
+    return [
+        book.title,
+        str(book.length) if book.length else "",
+        str(book.current_page) if book.current_page else "",
+        str(book.time_per_page_seconds) if book.time_per_page_seconds else "",
+    ]
 
 
-def save_read_csv(reads: List[Dict[str, object]]) -> str:
+def save_read_csv(reads: list[Book]) -> str:
     """Save reading list to read.csv."""
     data_dir = get_data_dir()
     read_csv = os.path.join(data_dir, "read.csv")
@@ -427,32 +665,31 @@ def save_read_csv(reads: List[Dict[str, object]]) -> str:
     with open(read_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(["title", "length", "current_page", "time_per_page_seconds"])
-        for read_item in reads:
-            title = read_item.get("title", "")
-            length = read_item.get("length", 0)
-            current_page = read_item.get("current_page", 0)
-            time_per_page_seconds = read_item.get("time_per_page_seconds", 0)
+        writer.writerows(_read_row(book) for book in reads)
 
-            writer.writerow(
-                [
-                    title,
-                    str(length) if length else "",
-                    str(current_page) if current_page else "",
-                    str(time_per_page_seconds) if time_per_page_seconds else "",
-                ]
-            )
+    return read_csv
+
+
+def append_read_csv(book: Book) -> str:
+    """Append a single book to read.csv without rewriting the other rows."""
+    data_dir = get_data_dir()
+    read_csv = os.path.join(data_dir, "read.csv")
+    _ensure_read_csv_header(read_csv)
+
+    with open(read_csv, "a", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerow(_read_row(book))
 
     return read_csv
 
 
 def _ensure_log_csv_header(path: str) -> None:
-    if not os.path.exists(path) or os.path.getsize(path) == 0:
+    if _file_size(path) <= 0:
         with open(path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(["message", "timestamp"])
 
 
-def append_log_csv(message: str, when: Optional[dt.datetime] = None) -> str:
+def append_log_csv(message: str, when: dt.datetime | None = None) -> str:
     """Append a message with timestamp to log.csv."""
     data_dir = get_data_dir()
     log_csv = os.path.join(data_dir, "log.csv")
@@ -464,22 +701,131 @@ def append_log_csv(message: str, when: Optional[dt.datetime] = None) -> str:
     return log_csv
 
 
-def load_log_csv() -> List[Dict[str, object]]:
-    """Load logs as a list of dicts."""
+def append_log_csv_many(
+    messages: Iterable[str], when: dt.datetime | None = None
+) -> tuple[str, int]:
+    """Append several messages with one shared timestamp to log.csv.
+
+    The file is opened and synced to disk once for the whole batch. Returns the
+    path and the number of messages written.
+    """
+    data_dir = get_data_dir()
+    log_csv = os.path.join(data_dir, "log.csv")
+    _ensure_log_csv_header(log_csv)
+    timestamp = (when or dt.datetime.now()).isoformat()
+    with open(log_csv, "a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        count = 0
+        for message in messages:
+            writer.writerow([message, timestamp])
+            count += 1
+        f.flush()
+        os.fsync(f.fileno())
+    return log_csv, count
+
+
+def _log_row(row: list[str], message_i: int, ts_i: int) -> dict[str, object]:
+    """Turn one parsed log.csv row into a log dict, by header column index."""
+    n = len(row)
+    message = row[message_i] if 0 <= message_i < n else ""
+    ts_str = row[ts_i] if 0 <= ts_i < n else ""
+    try:
+        ts = dt.datetime.fromisoformat(ts_str) if ts_str else None
+    except ValueError:
+        ts = None
+    return {"message": message, "timestamp": ts}
+
+
+def iter_log_csv() -> Iterator[dict[str, object]]:
+    """Yield logs oldest first, one row at a time; see load_log_csv."""
     data_dir = get_data_dir()
     log_csv = os.path.join(data_dir, "log.csv")
-    if not os.path.exists(log_csv) or os.path.getsize(log_csv) == 0:
-        return []
+    if _file_size(log_csv) <= 0:
+        return
 
-    rows: List[Dict[str, object]] = []
     with open(log_csv, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        # Column positions from the header, as in iter_sessions_csv
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = {name: i for i, name in enumerate(header)}
+        message_i = columns.get("message", -1)
+        ts_i = columns.get("timestamp", -1)
         for row in reader:
-            message = row.get("message", "")
-            ts_str = row.get("timestamp", "")
-            try:
-                ts = dt.datetime.fromisoformat(ts_str) if ts_str else None
-            except ValueError:
-                ts = None
-            rows.append({"message": message, "timestamp": ts})
-    return rows
+            if not row:
+                continue  # blank line; DictReader skipped these too
+            yield _log_row(row, message_i, ts_i)
+
+
+def load_log_csv() -> list[dict[str, object]]:
+    """Load logs as a list of dicts."""
+    return list(iter_log_csv())
+
+
+def _iter_lines_reverse(
+    f: BinaryIO, chunk_size: int = 8192
+) -> Iterator[tuple[int, bytes]]:
+    """Yield (offset, line) for the lines of f from last to first.
+
+    The first line (the header) is not yielded.
+    """
+    pos = f.seek(0, os.SEEK_END)
+    tail = b""
+    while pos > 0:
+        step = min(chunk_size, pos)
+        pos -= step
+        f.seek(pos)
+        lines = (f.read(step) + tail).split(b"\n")
+        # The first piece may be the end of a line that starts further back
+        tail = lines.pop(0)
+        offset = pos + len(tail) + 1
+        starts: list[int] = []
+        for line in lines:
+            starts.append(offset)
+            offset += len(line) + 1
+        yield from zip(reversed(starts), reversed(lines))
+    # What remains is the header line
+
+
+def iter_log_csv_reverse() -> Iterator[dict[str, object]]:
+    """Yield logs newest first, reading log.csv backwards from its end.
+
+    Lines after the last quote character in the file cannot be inside a
+    quoted field, so each of them is a whole record and is parsed on its own.
+    From the last line holding a quote backwards, record boundaries cannot be
+    told from the lines alone; that part of the file is parsed forwards with
+    csv.reader and its rows are yielded in reverse.
+    """
+    log_csv = os.path.join(get_data_dir(), "log.csv")
+    if _file_size(log_csv) <= 0:
+        return
+
+    with open(log_csv, "rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8").rstrip("\r\n")]), None)
+        if header is None:
+            return
+        columns = {name: i for i, name in enumerate(header)}
+        message_i = columns.get("message", -1)
+        ts_i = columns.get("timestamp", -1)
+
+        # Start of the part of the file not yet yielded
+        unread = f.seek(0, os.SEEK_END)
+        for offset, line in _iter_lines_reverse(f):
+            if b'"' in line:
+                break
+            unread = offset
+            line = line.rstrip(b"\r")
+            if line:
+                row = line.decode("utf-8").split(",")
+                yield _log_row(row, message_i, ts_i)
+        else:
+            return
+
+        f.seek(0)
+        text = f.read(unread).decode("utf-8")
+    reader = csv.reader(io.StringIO(text, newline=""))
+    next(reader, None)
+    rows = [row for row in reader if row]
+    for row in reversed(rows):
+        yield _log_row(row, message_i, ts_i)
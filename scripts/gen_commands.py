@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Regenerate hiper/commands/_generated_commands.py.
+
+Imports every module in hiper/commands/ that defines get_command() and writes
+the resulting names and help strings as a literal table, so the CLI can list
+commands and render --help without importing them. Re-run this after adding a
+command or changing a command's help text.
+"""
+
+import importlib
+import json
+import os
+import pkgutil
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT = os.path.join(REPO_DIR, "hiper", "commands", "_generated_commands.py")
+
+HEADER = """\
+# Generated by scripts/gen_commands.py; do not edit by hand.
+
+# name -> ("module:factory", help)
+COMMANDS: dict[str, tuple[str, str]] = {
+"""
+
+
+def main() -> int:
+    sys.path.insert(0, REPO_DIR)
+    package = importlib.import_module("hiper.commands")
+
+    entries = []
+    for info in pkgutil.iter_modules(package.__path__):
+        if info.name.startswith("_"):
+            continue
+        module_path = f"hiper.commands.{info.name}"
+        module = importlib.import_module(module_path)
+        factory = getattr(module, "get_command", None)
+        if factory is None:
+            continue
+        command = factory()
+        entries.append((command.name, f"{module_path}:get_command", command.help))
+
+    lines = [HEADER]
+    for name, entry_point, help_text in sorted(entries):
+        lines.append(f"    {json.dumps(name)}: (\n")
+        lines.append(f"        {json.dumps(entry_point)},\n")
+        lines.append(f"        {json.dumps(help_text, ensure_ascii=False)},\n")
+        lines.append("    ),\n")
+    lines.append("}\n")
+
+    with open(OUTPUT, "w", encoding="utf-8") as f:
+        f.write("".join(lines))
+    print(f"Wrote {len(entries)} commands to {os.path.relpath(OUTPUT, REPO_DIR)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,18 @@
+import os
+
+import pytest
+
+from hiper import config, storage
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Point config.json and all CSV files at a fresh temporary directory."""
+    path = str(tmp_path / "hiper")
+    monkeypatch.setattr(config, "_DEFAULT_DATA_DIR", path)
+    monkeypatch.setattr(config, "_CONFIG_FILE", os.path.join(path, "config.json"))
+    monkeypatch.setattr(config, "_DIR_READY", False)
+    config.invalidate_cache()
+    monkeypatch.setattr(storage, "_READY_DATA_DIR", None)
+    yield path
+    config.invalidate_cache()
@@ -0,0 +1,46 @@
+import pytest
+
+from hiper import cli
+from hiper.commands import COMMAND_REGISTRY, Command, register_command
+
+
+@pytest.fixture
+def hello():
+    """Register a third-party "hello" command for the duration of a test."""
+    calls = []
+
+    def configure(p):
+        p.add_argument("--name", default="world")
+
+    def run(args):
+        calls.append(args.name)
+        return 0
+
+    register_command(
+        Command(name="hello", help="Say hello.", configure_parser=configure, run=run)
+    )
+    yield calls
+    del COMMAND_REGISTRY["hello"]
+
+
+def test_registered_command_runs(hello):
+    assert cli.main(["hello"]) == 0
+    assert cli.main(["hello", "--name", "hiper"]) == 0
+    assert hello == ["world", "hiper"]
+
+
+def test_registered_command_in_full_parser(hello, capsys):
+    args = cli.build_parser().parse_args(["hello", "--name", "x"])
+    assert args.command == "hello"
+    assert args.name == "x"
+
+    assert cli.main(["--list"]) == 0
+    out = capsys.readouterr().out
+    assert "  hello\n" in out
+    assert "  fokus\n" in out
+
+
+def test_unknown_command_still_rejected():
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["no-such-command"])
+    assert exc.value.code == 2
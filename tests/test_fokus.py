@@ -0,0 +1,24 @@
+import pytest
+
+from hiper.commands.fokus import _parse_save_command
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("save", (True, None)),
+        ("  SAVE  ", (True, None)),
+        ("save --title Deep work", (True, "Deep work")),
+        ("save --TITLE x", (True, "x")),
+        ("save --title 'Deep work' ignored", (True, "Deep work")),
+        ('save --title "unterminated', (True, "unterminated")),
+        ("save --title=x", (True, "x")),
+        ("save --title", (True, None)),
+        ("save --titles x", (True, None)),
+        ("save --titles x --title y", (True, "y")),
+        ("save x--title y", (True, None)),
+        ("quit", (False, None)),
+    ],
+)
+def test_parse_save_command(line, expected):
+    assert _parse_save_command(line) == expected
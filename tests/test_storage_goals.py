@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from hiper import storage
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _goals_with_extra_field(data_dir):
+    path = os.path.join(data_dir, "goals.csv")
+    os.makedirs(data_dir, exist_ok=True)
+    storage._ensure_goals_csv_header(path)
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        f.write("alpha,60,1m,,,0,0s,,extra\r\n")
+    return path
+
+
+def test_stream_update_drops_extra_fields(data_dir):
+    path = _goals_with_extra_field(data_dir)
+
+    assert storage.stream_update_goals_csv(lambda row: True, lambda row: row) == 1
+    assert [g.title for g in storage.load_goals_csv()] == ["alpha"]
+    assert "extra" not in _read(path)
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_stream_update_removes_tmp_on_error(data_dir):
+    path = _goals_with_extra_field(data_dir)
+    before = _read(path)
+
+    def fail(row):
+        raise RuntimeError("transform failed")
+
+    with pytest.raises(RuntimeError):
+        storage.stream_update_goals_csv(lambda row: True, fail)
+    assert _read(path) == before
+    assert not os.path.exists(path + ".tmp")
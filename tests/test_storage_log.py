@@ -0,0 +1,80 @@
+import csv
+import datetime as dt
+import os
+
+import pytest
+
+from hiper import storage
+
+MESSAGES = [
+    "plain",
+    "with, comma",
+    'a "quoted" word',
+    "two\nlines",
+    "windows\r\nline end",
+    "fake end,2024-01-01T00:00:00\nnext line",
+    '"\n,2024-01-01T00:00:00\n"',
+    "trailing newline\n",
+    "",
+    "last plain",
+]
+
+
+def _write_log(data_dir, messages):
+    start = dt.datetime(2024, 3, 1, 12, 0, 0)
+    for i, message in enumerate(messages):
+        storage.append_log_csv(message, start + dt.timedelta(minutes=i))
+    return os.path.join(data_dir, "log.csv")
+
+
+@pytest.mark.parametrize("rotation", range(len(MESSAGES)))
+def test_reverse_matches_forward_with_multiline_messages(data_dir, rotation):
+    messages = MESSAGES[rotation:] + MESSAGES[:rotation]
+    _write_log(data_dir, messages)
+
+    forward = storage.load_log_csv()
+    assert [log["message"] for log in forward] == messages
+    assert list(storage.iter_log_csv_reverse()) == forward[::-1]
+
+
+def test_reverse_reads_small_chunks(data_dir, monkeypatch):
+    _write_log(data_dir, MESSAGES * 20)
+    original = storage._iter_lines_reverse
+    monkeypatch.setattr(
+        storage, "_iter_lines_reverse", lambda f: original(f, chunk_size=7)
+    )
+
+    assert list(storage.iter_log_csv_reverse()) == storage.load_log_csv()[::-1]
+
+
+def test_reverse_unquoted_tail_only(data_dir):
+    messages = ["first", "second", "third"]
+    _write_log(data_dir, messages)
+
+    reverse = list(storage.iter_log_csv_reverse())
+    assert [log["message"] for log in reverse] == messages[::-1]
+    assert all(isinstance(log["timestamp"], dt.datetime) for log in reverse)
+
+
+def test_reverse_header_only(data_dir):
+    path = os.path.join(data_dir, "log.csv")
+    os.makedirs(data_dir, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerow(["message", "timestamp"])
+
+    assert list(storage.iter_log_csv_reverse()) == []
+
+
+def test_log_last_keeps_out_of_order_rows(data_dir, capsys):
+    from hiper.commands import log
+
+    now = dt.datetime.now()
+    # Written after a clock shift back: the newest row has an older timestamp
+    storage.append_log_csv("before shift", now - dt.timedelta(minutes=30))
+    storage.append_log_csv("after\nshift", now - dt.timedelta(minutes=50))
+    storage.append_log_csv("too old", now - dt.timedelta(hours=3))
+
+    assert log._print_logs_since("1h") == 0
+    out = capsys.readouterr().out
+    assert out.index("after\nshift") < out.index("before shift")
+    assert "too old" not in out